@@ -16,15 +16,30 @@ import sys
 import json
 import calendar
 import re
-import urllib.request
+import string
+import urllib.error
 import urllib.parse
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 import subprocess
+import time
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
 import random
 import uuid
 import hashlib
 import csv
+import sqlite3
+from array import array
+import atexit
+from functools import lru_cache, partial, wraps
+from contextlib import contextmanager
+
+try:  # optional (pyobjc): run AppleScript in-process instead of spawning osascript
+    from Foundation import NSAppleScript, NSAppleEventDescriptor
+except Exception:
+    NSAppleScript = None
 
 
 # ----- List names (top-level, no groups) -----
@@ -50,6 +65,7 @@ STATE_PATH  = os.path.join(CONFIG_DIR, "state.json")
 CONFIG_PATH = os.path.join(CONFIG_DIR, "config.json")
 LOG_PATH    = os.path.join(CONFIG_DIR, "agent.log")
 CSV_PATH    = os.path.join(CONFIG_DIR, "progress.csv")
+SCRIPTURE_CACHE_PATH = os.path.join(CONFIG_DIR, "scripture_cache.sqlite3")
 
 # ----- Scripture API endpoints -----
 # LDS canon capable; expects spaces as '+' in q=... (use urlencode → quote_plus)
@@ -59,27 +75,155 @@ BIBLE_API_BASE = "https://bible-api.com/"
 
 # ----- Auto-add frequency gate -----
 AUTO_ADD_EVERY_N_DAYS = 0  # set to 1 for daily, 7 for weekly, 0 to disable gate
+AUTO_ADD_TOPIC_DEFAULT: Optional[str] = None  # auto_add.topic_default, None when blank
+
+# ----- Verse obfuscation (overridden by apply_config) -----
+OBF_ENABLED = True
+OBF_SEPARATOR = "\n\n______________________________\n"
+OBF_SCHEDULE = [1.0, 0.75, 0.5, 0.35, 0.2]
+OBF_MIN_LEN = 3
+OBF_KEEP_FL = False
+OBF_RESPECT_PUNCT = True
+OBF_BUFFER_LINES = 4
+OBF_BUFFER_TOKEN = "."
 
 
 # ====================================================================
 # AppleScript runner
 # ====================================================================
+# Compiled scripts are cached by content hash so osascript skips re-parsing the
+# source on every call. Any compile failure falls back to `osascript -e`.
+# In memory the cache is keyed by the source itself, so a repeat call costs one
+# dict lookup (str hashes are cached) and the digest is only taken on a miss.
+SCRIPT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "scripture_agent")
+_COMPILED_SCRIPTS: Dict[str, Optional[str]] = {}
+
+def _compiled_script_path(script: str) -> Optional[str]:
+    if script in _COMPILED_SCRIPTS:
+        return _COMPILED_SCRIPTS[script]
+    key = hashlib.sha1(script.encode("utf-8")).hexdigest()
+    path = os.path.join(SCRIPT_CACHE_DIR, f"{key}.scpt")
+    if not os.path.exists(path):
+        tmp = os.path.join(SCRIPT_CACHE_DIR, f"{key}.{os.getpid()}.{threading.get_ident()}.tmp.scpt")
+        try:
+            os.makedirs(SCRIPT_CACHE_DIR, exist_ok=True)
+            subprocess.run(["osacompile", "-o", tmp, "-e", script],
+                           check=True, capture_output=True, text=True)
+            os.replace(tmp, path)  # atomic: concurrent runs never see a partial file
+        except Exception:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            path = None
+    _COMPILED_SCRIPTS[script] = path
+    return path
+
+# In-process path (PyObjC). NSAppleScript is main-thread only, so worker threads
+# (_list_many, concurrent fills) keep using osascript.
+_NS_SCRIPTS: Dict[str, Any] = {}
+
+def _fourcc(code: str) -> int:
+    return int.from_bytes(code.encode("ascii"), "big")
+
+def _run_as_inprocess(script: str, args) -> str:
+    compiled = _NS_SCRIPTS.get(script)
+    if compiled is None:
+        compiled = NSAppleScript.alloc().initWithSource_(script)
+        ok, err = compiled.compileAndReturnError_(None)
+        if not ok:
+            raise RuntimeError(f"AppleScript compile failed: {err}")
+        _NS_SCRIPTS[script] = compiled
+    # 'run' handler event (aevt/oapp) with argv as the direct parameter
+    event = NSAppleEventDescriptor.appleEventWithEventClass_eventID_targetDescriptor_returnID_transactionID_(
+        _fourcc("aevt"), _fourcc("oapp"), NSAppleEventDescriptor.nullDescriptor(), -1, 0)
+    argv = NSAppleEventDescriptor.listDescriptor()
+    for i, a in enumerate(args, 1):
+        argv.insertDescriptor_atIndex_(NSAppleEventDescriptor.descriptorWithString_(str(a)), i)
+    event.setParamDescriptor_forKeyword_(argv, _fourcc("----"))
+    result, err = compiled.executeAppleEvent_error_(event, None)
+    if result is None:
+        raise RuntimeError(f"AppleScript error: {err}")
+    return (result.stringValue() or "").strip()
+
 def run_as(script: str, *args: str) -> str:
+    if NSAppleScript is not None and threading.current_thread() is threading.main_thread():
+        return _run_as_inprocess(script, args)
+    path = _compiled_script_path(script)
+    cmd = ["osascript", path, *args] if path else ["osascript", "-e", script, *args]
     return subprocess.run(
-        ["osascript", "-e", script, *args],
+        cmd,
         check=True, capture_output=True, text=True
     ).stdout.strip()
 
+_CREATE_REMINDER_SCRIPT = r'''
+on run argv
+  set listName to item 1 of argv
+  set theTitle to item 2 of argv
+  set theBody to item 3 of argv
+  tell application "Reminders"
+    set theList to first list whose name is listName
+    make new reminder at end of reminders of theList with properties {name:theTitle, body:theBody}
+  end tell
+end run
+'''
+
 
 # ========= Config (JSON, no deps) =========
+_TS_CACHE = [-1, ""]  # (epoch second, formatted) — bursts of events share one strftime
+
+def _now_str() -> str:
+    t = int(time.time())
+    if t != _TS_CACHE[0]:
+        _TS_CACHE[:] = [t, datetime.fromtimestamp(t).strftime("%Y-%m-%d %H:%M:%S")]
+    return _TS_CACHE[1]
+
+# Block-buffered handle on LOG_PATH, opened on first use. Lines reach the file in
+# bulk: when the buffer fills, at the end of run_daily (_flush_log), and at exit.
+# ERROR lines flush straight away so they survive a run that is killed mid-way.
+# Fetch/list worker threads log too, so open/write/flush/close share one lock.
+_LOG_FH = None
+_LOG_LOCK = threading.RLock()
+
+def _log_file():
+    """Open (or reopen after a LOG_PATH change) the shared handle; call with _LOG_LOCK held."""
+    global _LOG_FH
+    if _LOG_FH is None or _LOG_FH.name != LOG_PATH:
+        _close_log()
+        os.makedirs(CONFIG_DIR, exist_ok=True)
+        _LOG_FH = open(LOG_PATH, "a", encoding="utf-8", buffering=65536)
+    return _LOG_FH
+
+def _flush_log() -> None:
+    with _LOG_LOCK:
+        if _LOG_FH is not None:
+            try:
+                _LOG_FH.flush()
+            except OSError:
+                _close_log()
+
+def _close_log() -> None:
+    global _LOG_FH
+    with _LOG_LOCK:
+        if _LOG_FH is not None:
+            try:
+                _LOG_FH.close()
+            except OSError:
+                pass
+            _LOG_FH = None
+
+atexit.register(_close_log)
+
 def _append_log(line: str) -> None:
-    os.makedirs(CONFIG_DIR, exist_ok=True)
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    try:
-        with open(LOG_PATH, "a", encoding="utf-8") as f:
-            f.write(f"[{ts}] {line}\n")
-    except Exception:
-        pass
+    ts = _now_str()
+    with _LOG_LOCK:
+        try:
+            fh = _log_file()
+            fh.write(f"[{ts}] {line}\n")
+            if "ERROR" in line:
+                fh.flush()
+        except Exception:
+            _close_log()
 
 DEFAULT_CONFIG = {
     "lists": {
@@ -135,20 +279,50 @@ def _load_json(path: str):
         print(f"[config] failed to read {path}: {e}")
         return None
 
+def _write_json_atomic(path: str, data: dict, **dump_kw) -> None:
+    """Write to a sibling temp file and os.replace() it in (readers never see a torn file)."""
+    tmp = f"{path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, **dump_kw)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
 def _save_json(path: str, data: dict):
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        _write_json_atomic(path, data, indent=2)  # config stays hand-editable
     except Exception as e:
         print(f"[config] failed to write {path}: {e}")
 
+# Last parsed config.json, reused while the file's (path, mtime, size) is unchanged.
+_CONFIG_FILE_CACHE: Dict[str, Any] = {"stamp": None, "data": None}
+_APPLIED_CONFIG_KEY: Optional[str] = None  # canonical JSON of the config apply_config last applied
+
+def _config_file_stamp() -> Optional[tuple]:
+    try:
+        st = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    return (CONFIG_PATH, st.st_mtime_ns, st.st_size)
+
 def load_or_init_config() -> dict:
+    stamp = _config_file_stamp()
+    if stamp is not None and stamp == _CONFIG_FILE_CACHE["stamp"]:
+        return _CONFIG_FILE_CACHE["data"]
     _ensure_config_dir()
     cfg = _load_json(CONFIG_PATH)
     if cfg is None:
         cfg = DEFAULT_CONFIG
         _save_json(CONFIG_PATH, cfg)
         print(f"[config] created default config at {CONFIG_PATH}")
+        stamp = _config_file_stamp()
+    if stamp is not None:
+        _CONFIG_FILE_CACHE.update(stamp=stamp, data=cfg)
     return cfg
 
 def _get_last_doctor_fix_date() -> Optional[datetime]:
@@ -197,6 +371,12 @@ def _run_scheduled_fix_if_due(now: datetime) -> None:
 
 
 def apply_config(cfg: dict):
+    # run_daily's scheduled fix and doctor re-apply the same config; skip the rebuilds then
+    global _APPLIED_CONFIG_KEY
+    key = json.dumps(cfg, sort_keys=True, default=str)
+    if key == _APPLIED_CONFIG_KEY:
+        return
+
     global BACKLOG, DAILY, WEEKLY, MONTHLY, MASTERED
     BACKLOG  = cfg.get("lists", {}).get("backlog",  DEFAULT_CONFIG["lists"]["backlog"])
     DAILY    = cfg.get("lists", {}).get("daily",    DEFAULT_CONFIG["lists"]["daily"])
@@ -218,8 +398,9 @@ def apply_config(cfg: dict):
     MASTERED_REVIEW_MONTHS = list(cfg.get("mastered", {}).get("review_months",   DEFAULT_CONFIG["mastered"]["review_months"]))
     MASTERED_YEARLY_INTERVAL = int(cfg.get("mastered", {}).get("yearly_interval", DEFAULT_CONFIG["mastered"]["yearly_interval"]))
 
-    global AUTO_ADD_EVERY_N_DAYS
+    global AUTO_ADD_EVERY_N_DAYS, AUTO_ADD_TOPIC_DEFAULT
     AUTO_ADD_EVERY_N_DAYS = int(cfg.get("auto_add", {}).get("every_n_days", DEFAULT_CONFIG["auto_add"]["every_n_days"]))
+    AUTO_ADD_TOPIC_DEFAULT = ((cfg.get("auto_add", {}) or {}).get("topic_default") or "").strip() or None
 
     # Verse Obfuscation
     global OBF_ENABLED, OBF_SEPARATOR, OBF_SCHEDULE, OBF_MIN_LEN, OBF_KEEP_FL, OBF_RESPECT_PUNCT
@@ -235,125 +416,178 @@ def apply_config(cfg: dict):
     OBF_BUFFER_LINES = int(obf.get("buffer_lines", DEFAULT_CONFIG["obfuscation"]["buffer_lines"]))
     OBF_BUFFER_TOKEN = str(obf.get("buffer_token", DEFAULT_CONFIG["obfuscation"]["buffer_token"]))
 
+    _rebuild_ratio_table()
+    _rebuild_obf_scaffold()
+    _rebuild_mastered_gaps()
+    _APPLIED_CONFIG_KEY = key
+
 
 # ====================================================================
 # Readers
 # ====================================================================
-def list_reminders(list_name: str):
-    """
-    Returns [{'id': str, 'name': str, 'body': str, 'completed': bool, 'due': str}]
-    (Sanitizes CR/LF so each reminder is one line.)
-    """
-    script = r'''
-    on run argv
-      set listName to item 1 of argv
-      tell application "Reminders"
-        if not (exists (list listName)) then return ""
+_LIST_REMINDERS_SCRIPT = r'''
+on run argv
+  set outs to {}
+  repeat with argName in argv
+    set listName to argName as text
+    tell application "Reminders"
+      if exists (list listName) then
         set theList to first list whose name is listName
-        set out to ""
-        repeat with r in reminders of theList
-          set rid to id of r as text
-
-          -- name (strip CR/LF -> space)
-          set rname to name of r as text
-          set AppleScript's text item delimiters to return
-          set rname to text items of rname
-          set AppleScript's text item delimiters to " "
-          set rname to rname as text
-          set AppleScript's text item delimiters to linefeed
-          set rname to text items of rname
-          set AppleScript's text item delimiters to " "
-          set rname to rname as text
-          set AppleScript's text item delimiters to ""
-
-          -- body (strip CR/LF -> space)
-          if body of r is missing value then
-            set rbody to ""
-          else
-            set rbody to body of r as text
-            set AppleScript's text item delimiters to return
-            set rbody to text items of rbody
-            set AppleScript's text item delimiters to " "
-            set rbody to rbody as text
-            set AppleScript's text item delimiters to linefeed
-            set rbody to text items of rbody
-            set AppleScript's text item delimiters to " "
-            set rbody to rbody as text
-            set AppleScript's text item delimiters to ""
-          end if
-
-          set rcompleted to completed of r as text
-
-          -- due (strip CR/LF -> space)
-          if due date of r is missing value then
-            set rdue to ""
-          else
-            set rdue to (due date of r as string)
-            set AppleScript's text item delimiters to return
-            set rdue to text items of rdue
-            set AppleScript's text item delimiters to " "
-            set rdue to rdue as text
-            set AppleScript's text item delimiters to linefeed
-            set rdue to text items of rdue
-            set AppleScript's text item delimiters to " "
-            set rdue to rdue as text
-            set AppleScript's text item delimiters to ""
-          end if
-
-          set out to out & rid & "␞" & rname & "␞" & rbody & "␞" & rcompleted & "␞" & rdue & linefeed
-        end repeat
-      end tell
-      return out
-    end run
-    '''
-    out = run_as(script, list_name)
+        -- one Apple event per property, not per reminder
+        set ids to id of reminders of theList
+        set rnames to name of reminders of theList
+        set rbodies to body of reminders of theList
+        set rdone to completed of reminders of theList
+        set rdues to due date of reminders of theList
+      else
+        set ids to {}
+      end if
+    end tell
+    set recs to {}
+    repeat with i from 1 to count of ids
+      set b to item i of rbodies
+      if b is missing value then set b to ""
+      set d to item i of rdues
+      if d is missing value then
+        set d to ""
+      else
+        set d to d as string
+      end if
+      set end of recs to ((item i of ids) as text) & "␞" & (item i of rnames) & "␞" & b & "␞" & ((item i of rdone) as text) & "␞" & d
+    end repeat
+    set AppleScript's text item delimiters to "␝"
+    set end of outs to (recs as text)
+  end repeat
+  set AppleScript's text item delimiters to "␜"
+  set out to outs as text
+  set AppleScript's text item delimiters to ""
+  return out
+end run
+'''
+
+def _parse_reminder_records(out: str) -> list:
     items = []
-    for line in out.splitlines():
-        if not line.strip():
+    append = items.append
+    for rec in out.split("␝"):
+        head = rec.split("␞", 2)
+        if len(head) != 3:
+            continue  # empty list / defensive
+        tail = head[2].rsplit("␞", 2)  # a stray separator inside the body stays in the body
+        if len(tail) != 3:
             continue
-        parts = line.split("␞")
-        if len(parts) != 5:
-            continue  # defensive
-        rid, name, body, completed, due = parts
-        items.append({
-            "id": rid,
-            "name": name,
+        body, completed, due = tail
+        append({
+            "id": head[0].strip(),
+            "name": head[1].replace("\r", " ").replace("\n", " "),
             "body": body,
-            "completed": (completed.strip().lower() == "true"),
-            "due": due
+            "completed": completed[:1] in ("t", "T"),
+            "due": due.replace("\r", " ").replace("\n", " ")
         })
     return items
 
+def list_reminders_bulk(list_names) -> Dict[str, list]:
+    """
+    {list_name: list_reminders(list_name)} for several lists in ONE osascript call.
+    Lists are separated by "␜" in the script output; missing lists come back empty.
+    """
+    names = list(dict.fromkeys(list_names))
+    if not names:
+        return {}
+    chunks = run_as(_LIST_REMINDERS_SCRIPT, *names).split("␜")
+    if len(chunks) != len(names):
+        raise RuntimeError(f"list_reminders_bulk: expected {len(names)} lists, got {len(chunks)}")
+    return {ln: _parse_reminder_records(chunk) for ln, chunk in zip(names, chunks)}
+
+def list_reminders(list_name: str):
+    """
+    Returns [{'id': str, 'name': str, 'body': str, 'completed': bool, 'due': str}]
+    Bodies are returned raw (newlines kept), so no follow-up get_body_by_id_raw is needed.
+    Records are separated by "␝" and fields by "␞".
+    """
+    return _parse_reminder_records(run_as(_LIST_REMINDERS_SCRIPT, list_name))
+
+# Within a _list_cache_scope(), list reads are served from memory. Writers in
+# this module invalidate (due/create/delete/move) or patch (body/completed)
+# the affected list, so cached items stay consistent with Reminders.
+_LIST_CACHE: Dict[str, list] = {}
+_LIST_CACHE_DEPTH = 0
+_TITLE_INDEX: Optional[dict] = None  # _build_title_index() result for the current scope
+
+@contextmanager
+def _list_cache_scope():
+    global _LIST_CACHE_DEPTH, _TITLE_INDEX
+    _LIST_CACHE_DEPTH += 1
+    try:
+        yield
+    finally:
+        _LIST_CACHE_DEPTH -= 1
+        if _LIST_CACHE_DEPTH == 0:
+            _LIST_CACHE.clear()
+            _TITLE_INDEX = None
+
+def _cached_list_reminders(list_name: str) -> list:
+    if _LIST_CACHE_DEPTH == 0:
+        return list_reminders(list_name)
+    items = _LIST_CACHE.get(list_name)
+    if items is None:
+        items = list_reminders(list_name)
+        _LIST_CACHE[list_name] = items
+    return items
+
+def _list_many(list_names) -> Dict[str, list]:
+    """
+    Fetch several lists in one list_reminders_bulk call; if that fails, fall back to
+    concurrent per-list calls so one bad list doesn't hide the others.
+    Inside a _list_cache_scope() results come from / go into the cache.
+    Lists that fail to load are logged and left out of the result.
+    """
+    out: Dict[str, list] = {}
+    todo = []
+    for ln in list_names:
+        if _LIST_CACHE_DEPTH and ln in _LIST_CACHE:
+            out[ln] = _LIST_CACHE[ln]
+        elif ln not in todo:
+            todo.append(ln)
+    if not todo:
+        return out
+    try:
+        fetched = list_reminders_bulk(todo)
+    except Exception as e:
+        _append_log(f"[list_many] bulk listing failed, retrying per list: {e}")
+    else:
+        out.update(fetched)
+        if _LIST_CACHE_DEPTH:
+            _LIST_CACHE.update(fetched)
+        return out
+    with ThreadPoolExecutor(max_workers=len(todo)) as pool:
+        futures = {ln: pool.submit(list_reminders, ln) for ln in todo}
+    for ln, fut in futures.items():
+        try:
+            items = fut.result()
+        except Exception as e:
+            _append_log(f"[list_many] ERROR listing '{ln}': {e}")
+            continue
+        out[ln] = items
+        if _LIST_CACHE_DEPTH:
+            _LIST_CACHE[ln] = items
+    return out
+
+def _invalidate_lists(*list_names: str) -> None:
+    global _TITLE_INDEX
+    _TITLE_INDEX = None
+    for ln in list_names:
+        _LIST_CACHE.pop(ln, None)
+    _titles_cache_invalidate()
+
+def _patch_cached_item(list_name: str, rem_id: str, **fields) -> None:
+    for it in _LIST_CACHE.get(list_name) or ():
+        if it["id"] == rem_id:
+            it.update(fields)
+            return
+
 # ====================================================================
 # Writers
 # ====================================================================
-def set_notes(list_name: str, title: str, notes: str) -> bool:
-    script = r'''
-    on run argv
-      set listName to item 1 of argv
-      set theTitle to item 2 of argv
-      set theBody to item 3 of argv
-      tell application "Reminders"
-        set theList to first list whose name is listName
-        set targetRem to missing value
-        repeat with r in reminders of theList
-          if (name of r as text) is theTitle then
-            set targetRem to r
-            exit repeat
-          end if
-        end repeat
-        if targetRem is missing value then
-          return "NOT_FOUND"
-        else
-          set body of targetRem to theBody
-          return "OK"
-        end if
-      end tell
-    end run
-    '''
-    res = run_as(script, list_name, title, notes)
-    return res == "OK"
-
 def set_body_by_id(list_name: str, rem_id: str, body: str) -> bool:
     script = r'''
     on run argv
@@ -372,24 +606,83 @@ def set_body_by_id(list_name: str, rem_id: str, body: str) -> bool:
       end tell
     end run
     '''
-    return run_as(script, list_name, rem_id, body) == "OK"
-
-def _at_due_time(dt: datetime) -> datetime:
-    """Return dt at the configured due time (hour/minute, zero seconds)."""
-    return dt.replace(hour=DUE_HOUR, minute=DUE_MINUTE, second=0, microsecond=0)
-
-
-def set_due(list_name: str, reminder_id: str, y: int, m: int, d: int, hh: int, mm: int, ss: int = 0) -> bool:
+    ok = run_as(script, list_name, rem_id, body) == "OK"
+    if ok:
+        _patch_cached_item(list_name, rem_id, body=body)
+    return ok
+
+_BATCH_BODIES_SCRIPT = r'''
+on run argv
+  set listName to item 1 of argv
+  set payload to read (POSIX file (item 2 of argv)) as «class utf8»
+  set AppleScript's text item delimiters to "␝"
+  set recs to text items of payload
+  set AppleScript's text item delimiters to "␞"
+  set ids to {}
+  set bodies to {}
+  repeat with rec in recs
+    set fields to text items of (contents of rec)
+    if (count of fields) > 1 then
+      set end of ids to item 1 of fields
+      set end of bodies to (items 2 thru -1 of fields) as text
+    end if
+  end repeat
+  set AppleScript's text item delimiters to ""
+  set out to ""
+  tell application "Reminders"
+    set theList to first list whose name is listName
+    repeat with i from 1 to count of ids
+      set rid to item i of ids
+      try
+        set r to first reminder of theList whose id is rid
+        set body of r to (item i of bodies)
+        set out to out & "OK " & rid & linefeed
+      on error errMsg
+        set out to out & "ERR " & rid & " " & errMsg & linefeed
+      end try
+    end repeat
+  end tell
+  return out
+end run
+'''
+
+def batch_set_bodies(list_name: str, pairs) -> set:
     """
-    Back-compat wrapper. Prefer set_due_date(list_name, reminder_id, when).
-    Safe to delete once no callers remain.
+    Set many bodies on list_name in one osascript call. pairs: [(rem_id, body), ...].
+    The payload goes through a temp file (not argv) so large sweeps stay under ARG_MAX.
+    Returns the set of ids that were written.
     """
+    pairs = list(pairs)
+    if not pairs:
+        return set()
+    payload = "␝".join(f"{rid}␞{body}" for rid, body in pairs)
+    fd, path = tempfile.mkstemp(prefix="bodies.", suffix=".txt")
     try:
-        when = datetime(int(y), int(m), int(d), int(hh), int(mm), int(ss))
-        return set_due_date(list_name, reminder_id, when)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        out = run_as(_BATCH_BODIES_SCRIPT, list_name, path)
     except Exception as e:
-        _append_log(f"[set_due] wrapper ERROR for id={reminder_id} on '{list_name}': {e}")
-        return False
+        _append_log(f"[batch_bodies] ERROR writing {len(pairs)} note(s) on '{list_name}': {e}")
+        return set()
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    written = set()
+    for line in out.splitlines():
+        if line.startswith("OK "):
+            written.add(line[3:].strip())
+        elif line.strip():
+            _append_log(f"[batch_bodies] {line.strip()} on '{list_name}'")
+    for rid, body in pairs:
+        if rid in written:
+            _patch_cached_item(list_name, rid, body=body)
+    return written
+
+def _at_due_time(dt: datetime) -> datetime:
+    """Return dt at the configured due time (hour/minute, zero seconds)."""
+    return dt.replace(hour=DUE_HOUR, minute=DUE_MINUTE, second=0, microsecond=0)
 
 
 def set_due_date(list_name: str, reminder_id: str, when: datetime) -> bool:
@@ -429,7 +722,8 @@ def set_due_date(list_name: str, reminder_id: str, when: datetime) -> bool:
         end run
         '''
         args = [list_name, reminder_id, str(y), str(m), str(d), str(hh), str(mm), str(ss)]
-        subprocess.run(["osascript", "-e", applescript, *args], check=True)
+        run_as(applescript, *args)
+        _invalidate_lists(list_name)
         _append_log(f"[set_due] '{list_name}' id={reminder_id} → {when.isoformat()}")
         return True
     except subprocess.CalledProcessError as e:
@@ -441,8 +735,11 @@ def set_due_date(list_name: str, reminder_id: str, when: datetime) -> bool:
 
 
 
-def set_due_next_morning_8am(list_name: str, title: str) -> bool:
-    """Set due for the reminder (by title) to next morning at configured due time, via the id-based setter."""
+def set_due_next_morning_8am(list_name: str, title: str, when: Optional[datetime] = None) -> bool:
+    """
+    Set due for the reminder (by title) to next morning at configured due time, via the id-based setter.
+    Pass 'when' to reuse an already computed next-morning datetime.
+    """
     try:
         items = list_reminders(list_name)
         rid = None
@@ -454,7 +751,7 @@ def set_due_next_morning_8am(list_name: str, title: str) -> bool:
             _append_log(f"[set_due_next_morning_8am] NOT_FOUND '{title}' in '{list_name}'")
             return False
 
-        dt_target = _at_due_time(datetime.now() + timedelta(days=1))
+        dt_target = when if when is not None else next_morning_8am(datetime.now())
         return set_due_date(list_name, rid, dt_target)
     except Exception as e:
         _append_log(f"[set_due_next_morning_8am] ERROR for '{title}' on '{list_name}': {e}")
@@ -462,51 +759,40 @@ def set_due_next_morning_8am(list_name: str, title: str) -> bool:
 
 
 
-def delete_by_id(list_name: str, rem_id: str) -> bool:
-    script = r'''
-    on run argv
-      set listName to item 1 of argv
-      set rid to item 2 of argv
-      tell application "Reminders"
-        set theList to first list whose name is listName
-        try
-          delete (first reminder of theList whose id is rid)
-          return "OK"
-        on error
-          return "NOT_FOUND"
-        end try
-      end tell
-    end run
-    '''
-    return run_as(script, list_name, rem_id) == "OK"
-
-def mark_incomplete_by_id(list_name: str, rem_id: str) -> bool:
+def delete_many_by_id(list_name: str, rem_ids: List[str]) -> int:
+    """Delete several reminders in one AppleScript call; returns the number deleted."""
+    if not rem_ids:
+        return 0
     script = r'''
     on run argv
       set listName to item 1 of argv
-      set rid to item 2 of argv
+      set n to 0
       tell application "Reminders"
         set theList to first list whose name is listName
-        try
-          set r to first reminder of theList whose id is rid
-          set completed of r to false
-          return "OK"
-        on error
-          return "NOT_FOUND"
-        end try
+        repeat with i from 2 to (count of argv)
+          set rid to item i of argv
+          try
+            delete (first reminder of theList whose id is rid)
+            set n to n + 1
+          end try
+        end repeat
       end tell
+      return n as text
     end run
     '''
-    return run_as(script, list_name, rem_id) == "OK"
-
-def mark_incomplete_by_title(list_name: str, title: str) -> bool:
-    items = list_reminders(list_name)
-    m = next((x for x in items if x["name"].strip() == title.strip()), None)
-    if not m:
-        return False
-    return mark_incomplete_by_id(list_name, m["id"])
+    _invalidate_lists(list_name)
+    out = run_as(script, list_name, *rem_ids)
+    try:
+        return int(out or 0)
+    except ValueError:
+        return 0
 
 def get_body_by_id_raw(list_name: str, rem_id: str) -> str:
+    # Inside a _list_cache_scope() the listed (raw, write-patched) body is current
+    if _LIST_CACHE_DEPTH:
+        for it in _LIST_CACHE.get(list_name) or ():
+            if it["id"] == rem_id:
+                return (it["body"] or "").strip()
     script = r'''
     on run argv
       set listName to item 1 of argv
@@ -532,15 +818,122 @@ def get_body_by_id_raw(list_name: str, rem_id: str) -> str:
         return ""
 
 
+# ====================================================================
+# Batched writers (one osascript per stage)
+# ====================================================================
+# Ops are fixed-width argv rows: op, list, id, a1..a5
+#   due        a1..a4 = year, month, day, seconds-since-midnight
+#   incomplete (no args)
+#   move       a1 = destination list, a2..a5 = due (as above); creates the
+#              reminder in the destination with the source's raw name/body,
+#              then deletes the source
+_BATCH_FIELDS = 8
+
+_BATCH_SCRIPT = r'''
+on makeDate(y, m, d, secs)
+  set monthsList to {January, February, March, April, May, June, July, August, September, October, November, December}
+  set dueDate to (current date)
+  set day of dueDate to 1
+  set year of dueDate to y
+  set month of dueDate to (item m of monthsList)
+  set day of dueDate to d
+  set time of dueDate to secs
+  return dueDate
+end makeDate
+
+on run argv
+  set out to {}
+  tell application "Reminders"
+    repeat with i from 1 to (count of argv) by 8
+      set op to item i of argv
+      set listName to item (i + 1) of argv
+      set rid to item (i + 2) of argv
+      try
+        set theList to first list whose name is listName
+        set r to (first reminder of theList whose id is rid)
+        if op is "due" then
+          set due date of r to my makeDate((item (i + 3) of argv) as integer, (item (i + 4) of argv) as integer, (item (i + 5) of argv) as integer, (item (i + 6) of argv) as integer)
+        else if op is "incomplete" then
+          set completed of r to false
+        else if op is "move" then
+          set destList to first list whose name is (item (i + 3) of argv)
+          set dueDate to my makeDate((item (i + 4) of argv) as integer, (item (i + 5) of argv) as integer, (item (i + 6) of argv) as integer, (item (i + 7) of argv) as integer)
+          set b to body of r
+          if b is missing value then set b to ""
+          set newRem to make new reminder at end of reminders of destList with properties {name:(name of r), body:b, due date:dueDate}
+          delete r
+          set rid to (id of newRem as text)
+        else
+          error "unknown op " & op
+        end if
+        set end of out to "OK " & rid
+      on error errMsg
+        set end of out to "ERR " & rid & " " & errMsg
+      end try
+    end repeat
+  end tell
+  set AppleScript's text item delimiters to linefeed
+  return out as text
+end run
+'''
+
+def _due_args(when: datetime) -> tuple:
+    return (when.year, when.month, when.day, when.hour * 3600 + when.minute * 60 + when.second)
+
+def _queue_due(ops: list, list_name: str, rem_id: str, when: datetime) -> None:
+    ops.append(("due", list_name, rem_id) + _due_args(when))
+
+def _queue_incomplete(ops: list, list_name: str, rem_id: str) -> None:
+    ops.append(("incomplete", list_name, rem_id))
+
+def _queue_move(ops: list, from_list: str, rem_id: str, to_list: str, when: datetime) -> None:
+    """Move by id, preserving raw name/body; the new reminder is incomplete and due at 'when'."""
+    ops.append(("move", from_list, rem_id, to_list) + _due_args(when))
+
+def run_as_batch(ops: list) -> List[Optional[str]]:
+    """
+    Execute queued ops inside a single `tell application "Reminders"` block.
+    Returns one entry per op: the reminder id on success (the NEW id for moves), else None.
+    """
+    if not ops:
+        return []
+    argv: List[str] = []
+    for op in ops:
+        row = [str(x) for x in op]
+        argv += row + [""] * (_BATCH_FIELDS - len(row))
+    touched = {op[1] for op in ops if op[0] in ("due", "move")}
+    touched |= {op[3] for op in ops if op[0] == "move"}
+    if touched:
+        _invalidate_lists(*touched)
+    try:
+        lines = run_as(_BATCH_SCRIPT, *argv).splitlines()
+    except Exception as e:
+        _append_log(f"[batch] ERROR running {len(ops)} op(s): {e}")
+        return [None] * len(ops)
+    results: List[Optional[str]] = []
+    for i, op in enumerate(ops):
+        line = lines[i] if i < len(lines) else ""
+        if line.startswith("OK "):
+            results.append(line[3:].strip())
+            if op[0] == "incomplete":
+                _patch_cached_item(op[1], op[2], completed=False)
+        else:
+            _append_log(f"[batch] {op[0]} on '{op[1]}' id={op[2]} failed: {line or 'no result'}")
+            results.append(None)
+    return results
+
+
 # ====================================================================
 # Scripture HTTP helpers (no extra deps)
 # ====================================================================
 
 # --- Reference parsing & overlap detection ---
-_REF_PARSE = re.compile(
-    r"^\s*([A-Za-z0-9&’' .\-]+?)\s+(\d+)\s*:\s*(\d+)(?:\s*[-–]\s*(\d+))?\s*$",
-    re.IGNORECASE
-)
+# Shared by parse_reference (fullmatch on the stripped ref) and
+# _extract_reference (search within free text). Dashes are normalized first.
+_REF_CORE = re.compile(r"([A-Za-z0-9&’' .\-]+?)\s+(\d+)\s*:\s*(\d+)(?:\s*-\s*(\d+))?")
+
+def _normalize_dashes(s: str) -> str:
+    return s.replace("—", "-").replace("–", "-")
 
 def _normalize_book_name(book: str) -> str:
     b = (book or "").strip()
@@ -554,11 +947,10 @@ def _normalize_book_name(book: str) -> str:
     }
     if b_cf in aliases:
         return aliases[b_cf]
-    b_clean = re.sub(r"\s{2,}", " ", b).strip()
-    return b_clean
+    return " ".join(b.split())
 
 def parse_reference(ref: str):
-    m = _REF_PARSE.match((ref or "").replace("—", "-").replace("–", "-"))
+    m = _REF_CORE.fullmatch(_normalize_dashes((ref or "").strip()))
     if not m:
         return None
     book = _normalize_book_name(m.group(1))
@@ -580,51 +972,153 @@ def ranges_overlap(a, b) -> bool:
         return False
     return not (ae < bs or be < as_)
 
+# Titles only change when this module creates/deletes reminders, so cache them
+# for the process lifetime and invalidate on those mutations.
+_TITLES_CACHE: Optional[List[str]] = None
+_TITLES_INDEX: Optional[tuple] = None  # (exact: {norm_title: title}, parsed: [(title, ref)])
+
+def _titles_cache_invalidate() -> None:
+    global _TITLES_CACHE, _TITLES_INDEX
+    _TITLES_CACHE = None
+    _TITLES_INDEX = None
+
 def _titles_across_all_lists() -> list:
-    titles = []
-    for ln in [DAILY, WEEKLY, MONTHLY, BACKLOG]:
-        try:
-            titles += [x["name"] for x in list_reminders(ln)]
-        except Exception:
-            pass
-    return titles
+    global _TITLES_CACHE, _TITLES_INDEX
+    if _TITLES_CACHE is not None:
+        return list(_TITLES_CACHE)
+    order = [DAILY, WEEKLY, MONTHLY, BACKLOG]
+    lists = _list_many(order)  # one concurrent fetch; failed lists are left out
+    titles = [x["name"] for ln in order for x in lists.get(ln, [])]
+    complete = len(lists) == len(order)
+    if complete:
+        _TITLES_CACHE = titles  # don't pin a partial listing
+        _TITLES_INDEX = None
+    return list(titles)
+
+def _titles_index() -> tuple:
+    """
+    Return (exact, parsed) for the current titles:
+      - exact:  {normalized title: first title in list order}
+      - parsed: [(title, parsed_ref)] for titles that parse, in list order
+    Built once per titles-cache fill so overlap checks don't re-parse every title.
+    """
+    global _TITLES_INDEX
+    titles = _titles_across_all_lists()
+    if _TITLES_INDEX is not None and _TITLES_CACHE is not None:
+        return _TITLES_INDEX
+    exact: Dict[str, str] = {}
+    parsed = []
+    for t in titles:
+        exact.setdefault(_norm_title(t), t)
+        p = parse_reference(t)
+        if p:
+            parsed.append((t, p))
+    index = (exact, parsed)
+    if _TITLES_CACHE is not None:
+        _TITLES_INDEX = index
+    return index
+
+def _first_overlap(c_parsed, parsed) -> Optional[str]:
+    for t, e_parsed in parsed:
+        if ranges_overlap(c_parsed, e_parsed):
+            return t
+    return None
 
 def ref_overlaps_anywhere(candidate_ref: str) -> Optional[str]:
+    exact, parsed = _titles_index()
+    hit = exact.get(_norm_title(candidate_ref))
+    if hit is not None:
+        return hit  # exact duplicate: no parsing needed
     c_parsed = parse_reference(candidate_ref)
     if not c_parsed:
         return None
-    for t in _titles_across_all_lists():
-        e_parsed = parse_reference(t)
-        if e_parsed and ranges_overlap(c_parsed, e_parsed):
-            return t
-    return None
+    return _first_overlap(c_parsed, parsed)
+
+# Keep-alive connections, one per (scheme, host) per thread (fetches run on
+# worker threads), so repeat calls to a provider skip the TCP/TLS handshake.
+_HTTP_LOCAL = threading.local()
+
+def _http_conn(scheme: str, netloc: str, timeout: float) -> "http.client.HTTPConnection":
+    import http.client  # deferred: only commands that fetch pay for http/email/ssl
+    pool = getattr(_HTTP_LOCAL, "conns", None)
+    if pool is None:
+        pool = _HTTP_LOCAL.conns = {}
+    conn = pool.get((scheme, netloc))
+    if conn is None:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = pool[(scheme, netloc)] = cls(netloc, timeout=timeout)
+    else:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    return conn
+
+def _http_request(method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                  body: Optional[bytes] = None, timeout: float = 10.0, _redirects: int = 3) -> bytes:
+    """
+    Send one request over the pooled connection and return the body.
+    Raises on network errors and non-2xx responses; follows up to 3 redirects.
+    Only GET/HEAD reuse an idle keep-alive socket (and retry once if it was dropped);
+    other methods go out on a fresh socket and are never resent.
+    """
+    import http.client
+    u = urllib.parse.urlsplit(url)
+    path = (u.path or "/") + (f"?{u.query}" if u.query else "")
+    hdrs = {"Connection": "keep-alive", **(headers or {})}
+    while True:
+        conn = _http_conn(u.scheme, u.netloc, timeout)
+        if method not in ("GET", "HEAD") and conn.sock is not None:
+            conn.close()  # a POST must not land on a socket the server may have dropped
+        reused = conn.sock is not None
+        try:
+            conn.request(method, path, body=body, headers=hdrs)
+            resp = conn.getresponse()
+            data = resp.read()
+            break
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            _HTTP_LOCAL.conns.pop((u.scheme, u.netloc), None)
+            if not reused:
+                raise
+            # the server dropped an idle keep-alive socket: retry once on a fresh one
+    if resp.status in (301, 302, 303, 307, 308) and _redirects:
+        loc = resp.getheader("Location")
+        if loc:
+            keep = resp.status in (307, 308)
+            return _http_request(method if keep else "GET", urllib.parse.urljoin(url, loc),
+                                 headers, body if keep else None, timeout, _redirects - 1)
+    if not 200 <= resp.status < 300:
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+    return data
 
 def _http_get_json(url: str, timeout: float = 10.0) -> Optional[Dict[str, Any]]:
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "curl/8.7.1", "Accept": "*/*"})
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            data = resp.read()
+        data = _http_request("GET", url, {"User-Agent": "curl/8.7.1", "Accept": "*/*"}, timeout=timeout)
         return json.loads(data.decode("utf-8", errors="ignore"))
     except Exception:
         return None
 
 def _normalize_reference_for_nephi(ref: str) -> str:
     ref = (ref or "").strip().replace("–", "-")
-    ref = re.sub(r"\s+", " ", ref)
-    return ref
+    return " ".join(ref.split())
 
 # Clean & format helpers for verses
 _LEADING_VERSE_NUM_RE = re.compile(r"^\s*(\d+[:\u00A0\s]+)?(\d+)\s+")
 _BRACKETED_NUM_RE = re.compile(r"^\s*\[?\d+\]?\s*")
+_FOOTNOTE_LETTER_RE = re.compile(r"^[a-z]\s+")
 
 def _clean_line(s: str) -> str:
     s = s.replace("\u00A0", " ")
     s = s.strip()
-    s = _LEADING_VERSE_NUM_RE.sub("", s)
-    s = _BRACKETED_NUM_RE.sub("", s)
-    s = re.sub(r"^[a-z]\s+", "", s)  # strip leading footnote letters like 'a'
-    s = re.sub(r"\s{2,}", " ", s)
-    return s.strip()
+    # Most lines start with a word; only run the anchored regexes when the
+    # first character could actually begin a match.
+    if s[:1].isdigit():
+        s = _LEADING_VERSE_NUM_RE.sub("", s)
+    if s[:1].isdigit() or s[:1] == "[":
+        s = _BRACKETED_NUM_RE.sub("", s)
+    if "a" <= s[:1] <= "z":
+        s = _FOOTNOTE_LETTER_RE.sub("", s)  # strip leading footnote letters like 'a'
+    return " ".join(s.split())
 
 def _format_verses_paragraphs(verses: List[str]) -> str:
     cleaned = []
@@ -678,20 +1172,139 @@ def _try_bible_api(reference: str) -> Optional[str]:
 
     return _format_verses_paragraphs(verses)
 
+# --- Persistent text cache (sqlite, stdlib) ---
+# Scripture text never changes, so hits never expire. Misses are remembered for
+# SCRIPTURE_MISS_TTL seconds so a bad reference doesn't re-hit both providers.
+SCRIPTURE_MISS_TTL = 3600
+_SCRIPTURE_DB: Optional[tuple] = None  # (path, connection)
+_SCRIPTURE_DB_LOCK = threading.Lock()  # fills fetch from worker threads
+
+def _scripture_db() -> sqlite3.Connection:
+    global _SCRIPTURE_DB
+    if _SCRIPTURE_DB is None or _SCRIPTURE_DB[0] != SCRIPTURE_CACHE_PATH:
+        os.makedirs(os.path.dirname(SCRIPTURE_CACHE_PATH), exist_ok=True)
+        conn = sqlite3.connect(SCRIPTURE_CACHE_PATH, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS scripture (ref TEXT PRIMARY KEY, text TEXT, ts REAL)")
+        _SCRIPTURE_DB = (SCRIPTURE_CACHE_PATH, conn)
+    return _SCRIPTURE_DB[1]
+
+def _scripture_cache_get(key: str) -> tuple:
+    """(hit, text); a fresh cached miss is (True, None)."""
+    try:
+        with _SCRIPTURE_DB_LOCK:
+            row = _scripture_db().execute("SELECT text, ts FROM scripture WHERE ref = ?", (key,)).fetchone()
+    except sqlite3.Error as e:
+        _append_log(f"[fetch-cache] read ERROR: {e}")
+        return False, None
+    if row is None:
+        return False, None
+    text, ts = row
+    if text is None and time.time() - ts >= SCRIPTURE_MISS_TTL:
+        return False, None
+    return True, text
+
+def _scripture_cache_put(key: str, text: Optional[str]) -> None:
+    try:
+        with _SCRIPTURE_DB_LOCK:
+            db = _scripture_db()
+            db.execute("INSERT OR REPLACE INTO scripture (ref, text, ts) VALUES (?, ?, ?)",
+                       (key, text, time.time()))
+            db.commit()
+    except sqlite3.Error as e:
+        _append_log(f"[fetch-cache] write ERROR: {e}")
+
+def clear_scripture_cache() -> int:
+    """Drop every cached lookup; returns the number of rows removed."""
+    with _SCRIPTURE_DB_LOCK:
+        db = _scripture_db()
+        n = db.execute("DELETE FROM scripture").rowcount
+        db.commit()
+    return n
+
 def fetch_scripture_text(reference: str) -> Optional[str]:
     ref = (reference or "").strip()
     if not ref:
         print("[fetch] empty reference, skipping")
         return None
 
-    txt = _try_nephi_api(ref)
+    key = _norm_title(ref)
+    hit, txt = _scripture_cache_get(key)
+    if hit:
+        if not txt:
+            print(f"[fetch] cached miss for '{ref}'")
+        return txt
+    txt = _fetch_scripture_text_remote(ref)
+    _scripture_cache_put(key, txt)
+    return txt
+
+def prefetch_scripture_texts(refs) -> None:
+    """Warm the scripture cache for refs that aren't cached yet, fetching up to 8 at a time."""
+    todo, seen = [], set()
+    for ref in refs:
+        ref = (ref or "").strip()
+        key = _norm_title(ref)
+        if not ref or key in seen:
+            continue
+        seen.add(key)
+        if not _scripture_cache_get(key)[0]:
+            todo.append(ref)
+    if not todo:
+        return
+
+    def fetch(ref: str) -> None:
+        try:
+            fetch_scripture_text(ref)
+        except Exception as e:
+            _append_log(f"[prefetch] ERROR for '{ref}': {e}")
+
+    with ThreadPoolExecutor(max_workers=min(8, len(todo))) as pool:
+        list(pool.map(fetch, todo))
+
+def _titles_missing_text(items, blank_only: bool = False) -> List[str]:
+    """Titles of items whose state record has no full_text (optionally only blank-bodied items)."""
+    verses = _load_state().get("verses") or {}
+    out = []
+    for it in items:
+        if blank_only and (it.get("body") or "").strip():
+            continue
+        rec = verses.get(_norm_title(it.get("name") or ""))
+        if not (rec and (rec.get("full_text") or "").strip()):
+            out.append(it.get("name") or "")
+    return out
+
+# How long the LDS provider gets to answer before the Bible fallback is started
+# alongside it. Most lookups finish inside this, so the fallback is never sent.
+_LDS_HEAD_START = 1.5
+
+def _in_background(fn, *args) -> Future:
+    """Run fn(*args) on a daemon thread (exit never waits on it); returns its Future."""
+    fut: Future = Future()
+    def run():
+        try:
+            fut.set_result(fn(*args))
+        except BaseException as e:
+            fut.set_exception(e)
+    threading.Thread(target=run, daemon=True).start()
+    return fut
+
+def _fetch_scripture_text_remote(ref: str) -> Optional[str]:
+    # The LDS result wins when it has one. The Bible fallback only starts early
+    # (overlapping the wait) when LDS is slow; otherwise it runs only on a miss.
+    lds = _in_background(_try_nephi_api, ref)
+    bible = None
+    try:
+        txt = lds.result(timeout=_LDS_HEAD_START)
+    except FutureTimeout:
+        bible = _in_background(_try_bible_api, ref)
+        txt = lds.result()
+
     if txt:
         print(f"[fetch] OK via LDS provider for '{ref}'")
         return txt
-    else:
-        print(f"[fetch] LDS provider had no result for '{ref}'")
+    print(f"[fetch] LDS provider had no result for '{ref}'")
 
-    txt = _try_bible_api(ref)
+    txt = bible.result() if bible is not None else _try_bible_api(ref)
     if txt:
         print(f"[fetch] OK via Bible-only provider for '{ref}'")
         return txt
@@ -709,43 +1322,95 @@ def _openai_chat(prompt: str, model: str = "gpt-4o-mini") -> Optional[str]:
         print("[chatgpt] OPENAI_API_KEY not set; skipping")
         return None
     try:
-        req = urllib.request.Request(
+        raw = _http_request(
+            "POST",
             "https://api.openai.com/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json",
             },
-            data=json.dumps({
+            body=json.dumps({
                 "model": model,
                 "messages": [
                     {"role": "system", "content": "You are a concise assistant that only replies with a single contiguous Latter-day Saint scripture reference in the format 'Book Chapter:Verse' or 'Book Chapter:Start-End'. No commentary."},
                     {"role": "user", "content": prompt}
                 ],
                 "temperature": 0.5,
-            }).encode("utf-8")
+            }).encode("utf-8"),
+            timeout=20,
         )
-        with urllib.request.urlopen(req, timeout=20) as resp:
-            data = json.loads(resp.read().decode("utf-8", "ignore"))
+        data = json.loads(raw.decode("utf-8", "ignore"))
         text = data.get("choices", [{}])[0].get("message", {}).get("content", "")
         return (text or "").strip()
     except Exception as e:
         print(f"[chatgpt] error: {e}")
         return None
 
-_REF_RE = re.compile(r"([A-Za-z0-9&’' .\-]+)\s+(\d+):(\d+(?:-\d+)?)")
-
 def _extract_reference(s: str) -> Optional[str]:
     if not s:
         return None
-    m = _REF_RE.search(s.replace("–","-"))
+    m = _REF_CORE.search(_normalize_dashes(s))
     if not m:
         return None
-    book = re.sub(r"\s+", " ", m.group(1)).strip()
+    # Free text may wrap the reference in quotes/punctuation ("'John 3:16'"); the book starts at a word
+    book = _normalize_book_name(m.group(1).lstrip("’'&.- "))
+    if not any(c.isalpha() for c in book):
+        return None
     ch   = m.group(2)
-    vv   = m.group(3)
+    if m.group(4):
+        if int(m.group(4)) < int(m.group(3)):
+            return None  # reversed range ("Alma 58:11-6") is not a usable title
+        vv = f"{m.group(3)}-{m.group(4)}"
+    else:
+        vv = m.group(3)
     return f"{book} {ch}:{vv}"
 
+# Offline fallback for the ChatGPT suggester: well-known contiguous passages.
+_LOCAL_SUGGESTION_POOL = (
+    "Joshua 1:8-9", "Joshua 24:15", "Psalm 24:3-4", "Psalm 119:105", "Proverbs 3:5-6",
+    "Isaiah 1:18", "Isaiah 5:20", "Isaiah 29:13-14", "Isaiah 53:3-5", "Isaiah 58:6-7",
+    "Isaiah 58:13-14", "Jeremiah 1:4-5", "Ezekiel 37:15-17", "Amos 3:7", "Malachi 3:8-10",
+    "Malachi 4:5-6", "Matthew 5:14-16", "Matthew 11:28-30", "Matthew 16:15-19", "Matthew 22:36-39",
+    "Matthew 28:19-20", "Luke 24:36-39", "John 3:5", "John 14:6", "John 14:15",
+    "John 17:3", "1 Corinthians 6:19-20", "1 Corinthians 15:20-22", "Ephesians 4:11-14", "James 1:5-6",
+    "James 2:17-18", "1 Nephi 3:7", "2 Nephi 2:25", "2 Nephi 2:27", "2 Nephi 9:28-29",
+    "2 Nephi 28:7-9", "2 Nephi 31:19-20", "2 Nephi 32:3", "2 Nephi 32:8-9", "Mosiah 2:17",
+    "Mosiah 2:41", "Mosiah 3:19", "Mosiah 4:9", "Mosiah 18:8-10", "Alma 7:11-13",
+    "Alma 32:21", "Alma 34:9-10", "Alma 37:35", "Alma 39:9", "Alma 41:10",
+    "Helaman 5:12", "3 Nephi 11:10-11", "3 Nephi 27:20", "Ether 12:6", "Ether 12:27",
+    "Moroni 7:45-48", "Moroni 10:4-5", "Doctrine and Covenants 1:37-38", "Doctrine and Covenants 6:36",
+    "Doctrine and Covenants 8:2-3", "Doctrine and Covenants 13:1", "Doctrine and Covenants 18:10-11",
+    "Doctrine and Covenants 18:15-16", "Doctrine and Covenants 19:16-19", "Doctrine and Covenants 58:42-43",
+    "Doctrine and Covenants 64:9-11", "Doctrine and Covenants 76:22-24", "Doctrine and Covenants 82:10",
+    "Doctrine and Covenants 88:118", "Doctrine and Covenants 89:18-21", "Doctrine and Covenants 107:8",
+    "Doctrine and Covenants 121:36", "Doctrine and Covenants 121:41-42", "Doctrine and Covenants 130:22-23",
+    "Doctrine and Covenants 131:1-4", "Moses 1:39", "Moses 7:18", "Abraham 2:9-11",
+    "Abraham 3:22-23", "Joseph Smith—History 1:15-20",
+)
+
+def _suggest_reference_locally(exclusions: Optional[list[str]] = None) -> Optional[str]:
+    """Pick a pool reference that overlaps none of the exclusions (seeded per day)."""
+    parsed_excl = [p for p in (parse_reference(e) for e in (exclusions or [])) if p]
+    candidates = [
+        c for c in _LOCAL_SUGGESTION_POOL
+        if not any(ranges_overlap(parse_reference(c), e) for e in parsed_excl)
+    ]
+    if not candidates:
+        return None
+    return random.Random(datetime.now().strftime("%Y-%m-%d")).choice(candidates)
+
 def suggest_reference_via_chatgpt(topic: Optional[str] = None, exclusions: Optional[list[str]] = None) -> Optional[str]:
+    if os.environ.get("OFFLINE_SUGGEST"):
+        reason = "OFFLINE_SUGGEST set"
+    elif not os.environ.get("OPENAI_API_KEY", "").strip():
+        reason = "OPENAI_API_KEY not set"
+    else:
+        reason = None
+    if reason:
+        ref = _suggest_reference_locally(exclusions)
+        print(f"[chatgpt] {reason}; suggesting from local pool: {ref or '(none left)'}")
+        return ref
+
     avoid_list = exclusions or []
     avoid_block = ""
     if avoid_list:
@@ -772,24 +1437,35 @@ def suggest_reference_via_chatgpt(topic: Optional[str] = None, exclusions: Optio
 # ====================================================================
 # Notes fill (ID-based, normalized matching)
 # ====================================================================
-def _norm_title_key(t: str) -> str:
-    return (t or "").strip().casefold().replace("–", "-")
+_MO_RE = re.compile(r"#manual_override", re.IGNORECASE)
 
 def _contains_manual_override(note: str) -> bool:
-    if not note:
-        return False
-    return "#manual_override" in note.casefold()
+    """True if the note includes '#manual_override' (case-insensitive)."""
+    # Most notes have no '#': a plain substring test rejects them before the regex
+    return bool(note) and "#" in note and _MO_RE.search(note) is not None
 
-_SID_RE = re.compile(r"\[sid:([0-9a-fA-F-]{36})\]\s*$")
+_SID_RE = re.compile(r"\[sid:([0-9a-fA-F-]{36})\]")
+_SID_CHARS = "0123456789abcdefABCDEF-"
+
+def _find_sid(s: str) -> Optional[str]:
+    """First '[sid:<36 hex/dash chars>]' in s (same match as _SID_RE, without the regex engine)."""
+    if not s:
+        return None
+    i = s.find("[sid:")
+    while i >= 0:
+        end = i + 41
+        if end < len(s) and s[end] == "]":
+            cand = s[i + 5:end]
+            if not cand.strip(_SID_CHARS):
+                return cand
+        i = s.find("[sid:", i + 1)
+    return None
 
 def _new_sid() -> str:
     return str(uuid.uuid4())
 
 def _extract_sid(note: str) -> Optional[str]:
-    if not note:
-        return None
-    match = re.search(r"\[sid:([0-9a-fA-F-]{36})\]", note)
-    return match.group(1) if match else None
+    return _find_sid(note)
 
 def _append_sid(note: str, sid: str) -> str:
     """
@@ -800,14 +1476,36 @@ def _append_sid(note: str, sid: str) -> str:
     spacer = "\n" * 8  # <-- canonical: 8 newline spacer
     return f"{base}{spacer}[sid:{sid}]"
 
-def _contains_manual_override(note: str) -> bool:
-    """True if the note includes '#manual_override' (case-insensitive)."""
-    if not note:
-        return False
-    return "#manual_override" in note.casefold()
+# One pass for both signals: the override tag is case-insensitive, the SID tag
+# lowercase only (same rule as _find_sid/_extract_sid)
+_BODY_SCAN_RE = re.compile(r"(?i:(#manual_override))|\[sid:([0-9a-fA-F-]{36})\]")
+
+def _analyze_body(body: str) -> tuple:
+    """Single scan of a note body. Returns (has_manual_override, first_sid)."""
+    override, sid = False, None
+    if not body or ("#" not in body and "[" not in body):
+        return override, sid
+    for m in _BODY_SCAN_RE.finditer(body):
+        if m.group(1):
+            override = True
+        elif sid is None:
+            sid = m.group(2)
+        if override and sid:
+            break
+    return override, sid
+
+def _index_by_title(items) -> Dict[str, dict]:
+    """{normalized title: item}; the first item wins on duplicate titles."""
+    index: Dict[str, dict] = {}
+    for x in items:
+        index.setdefault(_norm_title(x["name"]), x)
+    return index
 
+def list_reminders_by_title(list_name: str) -> Dict[str, dict]:
+    """{normalized title: item} for a list; the first item wins on duplicate titles."""
+    return _index_by_title(list_reminders(list_name))
 
-def ensure_notes_for(list_name: str, title: str) -> bool:
+def ensure_notes_for(list_name: str, title: str, rec: Optional[dict] = None) -> bool:
     """
     Ensure the reminder has canonical scripture text in its notes.
     Rules:
@@ -818,49 +1516,49 @@ def ensure_notes_for(list_name: str, title: str) -> bool:
       - Preserve existing [sid:...] if present (append it back at the very bottom with spacing).
       - For Monthly, this function is only called from fill_notes_for_monthly() when body is blank.
         Obfuscation/canonical layout is handled there, not here.
+    Pass 'rec' when the caller already holds the state record to skip reloading it.
     """
-    want = _norm_title_key(title)
-    items = list_reminders(list_name)
-
-    # Find by normalized title
-    it = None
-    for x in items:
-        if _norm_title_key(x["name"]) == want:
-            it = x
-            break
+    it = list_reminders_by_title(list_name).get(_norm_title(title))
     if not it:
         return False
 
-    # Raw body (to preserve newlines and detect manual_override and SID)
-    raw_body = get_body_by_id_raw(list_name, it["id"])
-    sid = _extract_sid(raw_body)
-
-    if _contains_manual_override(raw_body):
+    # Listed bodies are raw (newlines kept), so manual_override/SID checks need no re-read
+    raw_body = it.get("body") or ""
+    override, sid = _analyze_body(raw_body)
+    if override:
         return True
 
-    rec = _get_or_init_record(title)
+    if rec is None:
+        rec = _get_or_init_record(title)
     canonical = (rec.get("full_text") or "").strip()
     if not canonical:
         canonical = (fetch_scripture_text(it["name"]) or fetch_scripture_text(title) or "").strip()
         if not canonical:
             return False
-        _update_record(title, full_text=canonical, full_text_sha=_sha1(canonical))
+        _update_record(title, full_text=canonical, full_text_sha=_fingerprint(canonical))
 
     new_body = canonical
     if sid:
         new_body = _append_sid(new_body, sid)
 
+    if rec.get("note_sig"):
+        _update_record(title, note_sig="")  # the Monthly layout is being replaced
+    if raw_body.strip() == new_body.strip():
+        return True  # already canonical: skip the AppleScript write
     return set_body_by_id(list_name, it["id"], new_body)
 
-def ensure_notes_for_by_id(list_name: str, rem_id: str, title: str) -> bool:
+def ensure_notes_for_by_id(list_name: str, rem_id: str, title: str,
+                           raw_body: Optional[str] = None) -> bool:
     """
     ID-based variant to avoid a list scan when we already have the reminder ID.
     Mirrors ensure_notes_for() behavior (state-first, respects #manual_override, preserves SID).
+    Pass raw_body when the caller already holds the freshly listed body.
     """
-    raw_body = get_body_by_id_raw(list_name, rem_id)
-    sid = _extract_sid(raw_body)
-
-    if _contains_manual_override(raw_body):
+    if raw_body is None:
+        raw_body = get_body_by_id_raw(list_name, rem_id)
+    raw_body = raw_body.strip()
+    override, sid = _analyze_body(raw_body)
+    if override:
         return True
 
     rec = _get_or_init_record(title)
@@ -870,21 +1568,191 @@ def ensure_notes_for_by_id(list_name: str, rem_id: str, title: str) -> bool:
         canonical = (fetch_scripture_text(title) or "").strip()
         if not canonical:
             return False
-        _update_record(title, full_text=canonical, full_text_sha=_sha1(canonical))
+        _update_record(title, full_text=canonical, full_text_sha=_fingerprint(canonical))
 
     new_body = canonical
     if sid:
         new_body = _append_sid(new_body, sid)
 
+    if rec.get("note_sig"):
+        _update_record(title, note_sig="")  # the Monthly layout is being replaced
+    if raw_body.strip() == new_body.strip():
+        return True  # already canonical: skip the AppleScript write
     return set_body_by_id(list_name, rem_id, new_body)
 
+# ====================================================================
+# Cadence state helpers
+# ====================================================================
+# Inside _state_txn(), _load_state() hands out one shared in-memory copy and
+# _save_state() only marks it dirty; the file is written once when the
+# outermost transaction exits.
+_STATE_TXN: Optional[dict] = None
+_STATE_TXN_DEPTH = 0
+_STATE_TXN_DIRTY = False
+_STATE_GEN = 0  # bumped on every _save_state(); lets derived indexes notice changes
+
+# Last parsed state.json, reused while the file's (path, mtime, size) is unchanged.
+_STATE_FILE_CACHE: Dict[str, Any] = {"stamp": None, "data": None}
+
+def _state_file_stamp() -> Optional[tuple]:
+    try:
+        st = os.stat(STATE_PATH)
+    except OSError:
+        return None
+    return (STATE_PATH, st.st_mtime_ns, st.st_size)
+
+def _read_state_file() -> dict:
+    stamp = _state_file_stamp()
+    if stamp is not None and stamp == _STATE_FILE_CACHE["stamp"]:
+        return _STATE_FILE_CACHE["data"]
+    try:
+        with open(STATE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return {"verses": {}}
+    _STATE_FILE_CACHE.update(stamp=stamp, data=data)
+    return data
+
+def _write_state_file(state: dict) -> None:
+    os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
+    _write_json_atomic(STATE_PATH, state, ensure_ascii=False, separators=(",", ":"))
+    _STATE_FILE_CACHE.update(stamp=_state_file_stamp(), data=state)
+
+def _load_state() -> dict:
+    if _STATE_TXN is not None:
+        return _STATE_TXN
+    return _read_state_file()
+
+def _save_state(state: dict) -> None:
+    global _STATE_TXN, _STATE_TXN_DIRTY, _STATE_GEN
+    _STATE_GEN += 1
+    if _STATE_TXN is not None:
+        _STATE_TXN = state
+        _STATE_TXN_DIRTY = True
+        return
+    _write_state_file(state)
+
+@contextmanager
+def _state_txn():
+    global _STATE_TXN, _STATE_TXN_DEPTH, _STATE_TXN_DIRTY
+    if _STATE_TXN_DEPTH == 0:
+        _STATE_TXN = _read_state_file()
+        _STATE_TXN_DIRTY = False
+    _STATE_TXN_DEPTH += 1
+    try:
+        yield
+    finally:
+        _STATE_TXN_DEPTH -= 1
+        if _STATE_TXN_DEPTH == 0:
+            state, dirty = _STATE_TXN, _STATE_TXN_DIRTY
+            _STATE_TXN, _STATE_TXN_DIRTY = None, False
+            if dirty:
+                _write_state_file(state)  # persist progress even if the body raised
+
+def _with_state_txn(fn):
+    """Run fn inside _state_txn() (one state write per command)."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with _state_txn():
+            return fn(*args, **kwargs)
+    return wrapper
+
+def _get_or_init_record(title: str, *, anchor_weekday: Optional[int] = None) -> dict:
+    key = _norm_title(title)
+    state = _load_state()
+    rec = state["verses"].get(key)
+    if rec is None:
+        rec = {
+            "title": title.strip(),
+            "stage": "daily",
+            "daily_count": 0,
+            "weekly_count": 0,
+            "monthly_count": 0,
+            "mastered_count": 0,
+            "anchor_weekday": anchor_weekday if anchor_weekday is not None else datetime.now().weekday(),
+            "sid": None,
+            "full_text": "",
+            "full_text_sha": ""
+        }
+        state["verses"][key] = rec
+        _save_state(state)
+    return rec
+
+def _update_record(title: str, **changes) -> None:
+    key = _norm_title(title)
+    state = _load_state()
+    rec = state["verses"].setdefault(key, {
+        "title": title.strip(),
+        "stage": "daily",
+        "daily_count": 0,
+        "weekly_count": 0,
+        "monthly_count": 0,
+        "mastered_count": 0,
+        "anchor_weekday": datetime.now().weekday(),
+    })
+    old_sid = rec.get("sid")
+    rec.update(changes)
+    gen = _STATE_GEN
+    _save_state(state)
+    if "sid" in changes and changes["sid"] != old_sid:
+        _sid_index_patch(state, gen, key, changes["sid"], old_sid)
+
+def _get_last_auto_added_date() -> Optional[datetime]:
+    state = _load_state()
+    iso = state.get("last_auto_added")
+    if not iso:
+        return None
+    try:
+        return datetime.fromisoformat(iso)
+    except Exception:
+        return None
+
+def _set_last_auto_added_date(d: datetime) -> None:
+    state = _load_state()
+    state["last_auto_added"] = d.isoformat()
+    _save_state(state)
+
+def _chatgpt_allowed_today(now: datetime) -> bool:
+    if AUTO_ADD_EVERY_N_DAYS <= 0:
+        return True
+    last = _get_last_auto_added_date()
+    if not last:
+        return True
+    return (now.date() - last.date()).days >= AUTO_ADD_EVERY_N_DAYS
+
+def _first_weekday_on_or_after(year: int, month: int, weekday: int, start_day: int = 1) -> datetime:
+    d = datetime(year, month, max(1, start_day), 8, 0, 0)
+    delta = (weekday - d.weekday()) % 7
+    return d + timedelta(days=delta)
+
+def _add_months(dt: datetime, months: int) -> datetime:
+    y = dt.year + (dt.month - 1 + months) // 12
+    m = (dt.month - 1 + months) % 12 + 1
+    last_day = calendar.monthrange(y, m)[1]
+    day = min(dt.day, last_day)
+    return dt.replace(year=y, month=m, day=day)
+
+def next_same_weekday_in_n_months_8am(anchor_weekday: int, base: datetime, months_ahead: int) -> datetime:
+    target = _add_months(base, months_ahead)
+    dt = _first_weekday_on_or_after(
+        target.year,
+        target.month,
+        anchor_weekday,
+        start_day=target.day
+    )
+    return _at_due_time(dt)
+
+
+
 
 # ====================================================================
 # Backlog → Daily
 # ====================================================================
+@lru_cache(maxsize=8192)  # same titles are normalized over and over in list scans
 def _norm_title(t: str) -> str:
     return (t or "").strip().casefold().replace("–", "-")
 
+@_with_state_txn
 def reset_backlog_items():
     """
     Reset the stage and counts for any items in the backlog list.
@@ -946,6 +1814,7 @@ def reset_backlog_items():
         _append_log(f"[backlog-reset] ERROR: {e}")
 
 
+@_with_state_txn
 def cleanup_deleted_items():
     """
     Remove state entries for items that have been deleted from Reminders.
@@ -988,6 +1857,7 @@ def cleanup_deleted_items():
         _append_log(f"[cleanup] ERROR: {e}")
 
 
+@_with_state_txn
 def maybe_add_new_verse_from_backlog(topic: Optional[str] = None) -> Optional[str]:
     """
     Add exactly one new verse to Daily, respecting the frequency gate for BOTH sources:
@@ -1006,31 +1876,53 @@ def maybe_add_new_verse_from_backlog(topic: Optional[str] = None) -> Optional[st
     """
     now = datetime.now()
 
-    # Collect existing titles (normalized string compare for exact dup pass)
-    daily_titles   = {_norm_title(x["name"]) for x in list_reminders(DAILY)}
-    weekly_titles  = {_norm_title(x["name"]) for x in list_reminders(WEEKLY)}
-    monthly_titles = {_norm_title(x["name"]) for x in list_reminders(MONTHLY)}
-    exists_elsewhere = daily_titles | weekly_titles | monthly_titles
-
-    # -------- Pass 1: clean exact duplicates from Backlog --------
-    backlog_items = list_reminders(BACKLOG)
-    for r in backlog_items:
+    # Collect existing titles once: normalized set for exact dups, parsed refs
+    # (in list order) for overlap checks.
+    # All four lists are fetched together. Dedupe needs every one of them, so a
+    # failed listing skips intake for this run instead of guessing.
+    order = (DAILY, WEEKLY, MONTHLY, BACKLOG)
+    lists = _list_many(order)
+    if len(lists) != len(order):
+        print("[new-verse] could not list every Reminders list; skipping intake this run.")
+        return None
+    exists_elsewhere = set()
+    parsed_refs = []  # [(title, parsed_ref)]
+    for ln in (DAILY, WEEKLY, MONTHLY):
+        for x in lists.get(ln, []):
+            exists_elsewhere.add(_norm_title(x["name"]))
+            p = parse_reference(x["name"])
+            if p:
+                parsed_refs.append((x["name"], p))
+
+    # -------- Single pass: classify Backlog items as exact dup / overlap / keep --------
+    # Kept Backlog items join parsed_refs as we go, so a later item that overlaps
+    # an earlier kept one is cleaned (same as re-listing after each delete).
+    backlog_items = []
+    to_delete = []
+    messages = []
+    for r in lists.get(BACKLOG, []):
         title = r["name"].strip()
-        if _norm_title(title) in exists_elsewhere:
-            delete_by_id(BACKLOG, r["id"])
-            print(f"Cleaned duplicate from Backlog: {title}")
+        norm = _norm_title(title)
+        if norm in exists_elsewhere:
+            to_delete.append(r["id"])
+            messages.append(f"Cleaned duplicate from Backlog: {title}")
+            continue
+        c_parsed = parse_reference(title)
+        if c_parsed:
+            overlapping = _first_overlap(c_parsed, parsed_refs)
+            if overlapping and norm != _norm_title(overlapping):
+                to_delete.append(r["id"])
+                messages.append(f"Cleaned overlapping Backlog item: {title} (overlaps {overlapping})")
+                continue
+            parsed_refs.append((r["name"], c_parsed))
+        backlog_items.append(r)
 
-    # -------- Pass 2: clean overlapping Backlog items --------
-    backlog_items = list_reminders(BACKLOG)  # refresh after exact dup cleanup
-    for r in backlog_items:
-        title = r["name"].strip()
-        overlapping = ref_overlaps_anywhere(title)
-        if overlapping and _norm_title(title) != _norm_title(overlapping):
-            delete_by_id(BACKLOG, r["id"])
-            print(f"Cleaned overlapping Backlog item: {title} (overlaps {overlapping})")
+    if to_delete:
+        delete_many_by_id(BACKLOG, to_delete)
+        for msg in messages:
+            print(msg)
 
-    # -------- Pass 3: Backlog intake (now gated) --------
-    backlog_items = list_reminders(BACKLOG)  # refresh again after overlap cleanup
+    # -------- Backlog intake (gated) --------
     if backlog_items:
         if not _chatgpt_allowed_today(now):  # reuse the same gate for *any* new intake
             print("[new-verse] Backlog has items, but frequency gate prevents intake today.")
@@ -1040,34 +1932,25 @@ def maybe_add_new_verse_from_backlog(topic: Optional[str] = None) -> Optional[st
         r = backlog_items[0]
         title = r["name"].strip()
 
-        # Create in Daily (preserve any existing body text from Backlog)
-        create_script = r'''
-        on run argv
-          set listName to item 1 of argv
-          set theTitle to item 2 of argv
-          set theBody to item 3 of argv
-          tell application "Reminders"
-            set theList to first list whose name is listName
-            make new reminder at end of reminders of theList with properties {name:theTitle, body:theBody}
-          end tell
-        end run
-        '''
-        run_as(create_script, DAILY, title, r.get("body",""))
-
-        # Delete from Backlog
-        delete_by_id(BACKLOG, r["id"])
+        # Move to Daily due next morning at configured time: create (raw name/body kept),
+        # set due and delete from Backlog in one AppleScript call
+        nm = next_morning_8am(now)
+        ops = []
+        _queue_move(ops, BACKLOG, r["id"], DAILY, nm)
+        if not run_as_batch(ops)[0]:
+            print(f"[new-verse] Could not move '{title}' from Backlog to Daily (see log).")
+            return None
 
-        # Due next morning at configured time + init cadence + ensure notes + SID
-        set_due_next_morning_8am(DAILY, title)
-        _get_or_init_record(title, anchor_weekday=now.weekday())
-        ensure_notes_for(DAILY, title)
+        # Init cadence + ensure notes + SID
+        rec = _get_or_init_record(title, anchor_weekday=now.weekday())
+        ensure_notes_for(DAILY, title, rec=rec)
         _ensure_sid_for_title(DAILY, title)
 
         # Record the intake date for the frequency gate
         _set_last_auto_added_date(now)
 
         # CSV log
-        next_due = next_morning_8am(now).strftime('%Y-%m-%d %H:%M')
+        next_due = nm.strftime('%Y-%m-%d %H:%M')
         _append_csv_event(title, "daily", "moved-from-backlog", next_due)
 
         print(f"New verse moved from Backlog → Daily (next review at {next_due.split(' ')[1]}): {title}")
@@ -1080,141 +1963,35 @@ def maybe_add_new_verse_from_backlog(topic: Optional[str] = None) -> Optional[st
 
     exclusions = existing_refs_across_all_lists()
     candidate = suggest_reference_via_chatgpt(topic=topic, exclusions=exclusions)
-    if not candidate:
-        print("[new-verse] ChatGPT did not provide a usable reference.")
-        return None
-
-    overlapping = ref_overlaps_anywhere(candidate)
-    if overlapping:
-        print(f"[new-verse] ChatGPT suggested '{candidate}', but it overlaps existing '{overlapping}'. "
-              f"Skipping add to avoid duplicates (no further calls).")
-        return None
-
-    # Create in Daily with empty body first
-    create_script = r'''
-    on run argv
-      set listName to item 1 of argv
-      set theTitle to item 2 of argv
-      tell application "Reminders"
-        set theList to first list whose name is listName
-        make new reminder at end of reminders of theList with properties {name:theTitle, body:""}
-      end tell
-    end run
-    '''
-    run_as(create_script, DAILY, candidate)
-
-    set_due_next_morning_8am(DAILY, candidate)
-    _get_or_init_record(candidate, anchor_weekday=now.weekday())
-    ensure_notes_for(DAILY, candidate)
-    _ensure_sid_for_title(DAILY, candidate)
-
-    # Record the intake date for the frequency gate (CHATGPT path)
-    _set_last_auto_added_date(now)
-
-    # CSV log
-    next_due = next_morning_8am(now).strftime('%Y-%m-%d %H:%M')
-    _append_csv_event(candidate, "daily", "chatgpt-added", next_due)
-
-    print(f"[ChatGPT] Added new verse to Daily (next review at {next_due.split(' ')[1]}): {candidate}")
-    return candidate
-
-
-
-# ====================================================================
-# Cadence state helpers
-# ====================================================================
-def _load_state() -> dict:
-    try:
-        with open(STATE_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return {"verses": {}}
-
-def _save_state(state: dict) -> None:
-    os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
-    with open(STATE_PATH, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2)
-
-def _get_or_init_record(title: str, *, anchor_weekday: Optional[int] = None) -> dict:
-    key = _norm_title(title)
-    state = _load_state()
-    rec = state["verses"].get(key)
-    if rec is None:
-        rec = {
-            "title": title.strip(),
-            "stage": "daily",
-            "daily_count": 0,
-            "weekly_count": 0,
-            "monthly_count": 0,
-            "mastered_count": 0,
-            "anchor_weekday": anchor_weekday if anchor_weekday is not None else datetime.now().weekday(),
-            "sid": None,
-            "full_text": "",
-            "full_text_sha": ""
-        }
-        state["verses"][key] = rec
-        _save_state(state)
-    return rec
-
-def _update_record(title: str, **changes) -> None:
-    key = _norm_title(title)
-    state = _load_state()
-    rec = state["verses"].setdefault(key, {
-        "title": title.strip(),
-        "stage": "daily",
-        "daily_count": 0,
-        "weekly_count": 0,
-        "monthly_count": 0,
-        "mastered_count": 0,
-        "anchor_weekday": datetime.now().weekday(),
-    })
-    rec.update(changes)
-    _save_state(state)
-
-def _get_last_auto_added_date() -> Optional[datetime]:
-    state = _load_state()
-    iso = state.get("last_auto_added")
-    if not iso:
+    if not candidate:
+        print("[new-verse] ChatGPT did not provide a usable reference.")
         return None
-    try:
-        return datetime.fromisoformat(iso)
-    except Exception:
+
+    overlapping = ref_overlaps_anywhere(candidate)
+    if overlapping:
+        print(f"[new-verse] ChatGPT suggested '{candidate}', but it overlaps existing '{overlapping}'. "
+              f"Skipping add to avoid duplicates (no further calls).")
         return None
 
-def _set_last_auto_added_date(d: datetime) -> None:
-    state = _load_state()
-    state["last_auto_added"] = d.isoformat()
-    _save_state(state)
+    # Create in Daily with empty body first
+    run_as(_CREATE_REMINDER_SCRIPT, DAILY, candidate, "")
+    _invalidate_lists(DAILY)
 
-def _chatgpt_allowed_today(now: datetime) -> bool:
-    if AUTO_ADD_EVERY_N_DAYS <= 0:
-        return True
-    last = _get_last_auto_added_date()
-    if not last:
-        return True
-    return (now.date() - last.date()).days >= AUTO_ADD_EVERY_N_DAYS
+    nm = next_morning_8am(now)
+    set_due_next_morning_8am(DAILY, candidate, when=nm)
+    rec = _get_or_init_record(candidate, anchor_weekday=now.weekday())
+    ensure_notes_for(DAILY, candidate, rec=rec)
+    _ensure_sid_for_title(DAILY, candidate)
 
-def _first_weekday_on_or_after(year: int, month: int, weekday: int, start_day: int = 1) -> datetime:
-    d = datetime(year, month, max(1, start_day), 8, 0, 0)
-    delta = (weekday - d.weekday()) % 7
-    return d + timedelta(days=delta)
+    # Record the intake date for the frequency gate (CHATGPT path)
+    _set_last_auto_added_date(now)
 
-def _add_months(dt: datetime, months: int) -> datetime:
-    y = dt.year + (dt.month - 1 + months) // 12
-    m = (dt.month - 1 + months) % 12 + 1
-    last_day = calendar.monthrange(y, m)[1]
-    day = min(dt.day, last_day)
-    return dt.replace(year=y, month=m, day=day)
+    # CSV log
+    next_due = nm.strftime('%Y-%m-%d %H:%M')
+    _append_csv_event(candidate, "daily", "chatgpt-added", next_due)
 
-def next_same_weekday_in_n_months_8am(anchor_weekday: int, base: datetime, months_ahead: int) -> datetime:
-    target = _add_months(base, months_ahead)
-    dt = _first_weekday_on_or_after(
-        target.year,
-        target.month,
-        anchor_weekday,
-        start_day=target.day
-    )
-    return _at_due_time(dt)
+    print(f"[ChatGPT] Added new verse to Daily (next review at {next_due.split(' ')[1]}): {candidate}")
+    return candidate
 
 
 
@@ -1325,196 +2102,199 @@ def _ensure_due_for_list(list_name: str, item: dict, now: Optional[datetime] = N
 # ====================================================================
 # Advance-on-complete (cadence-aware)
 # ====================================================================
-def move_by_title(from_list: str, to_list: str, title: str) -> Optional[str]:
-    """
-    Move reminder by exact title from one list to another, preserving RAW body (newlines).
-    Returns the NEW reminder ID in the destination list (or None on failure).
-    """
-    wanted = title.strip().lower()
-    items = list_reminders(from_list)
-    match = next((x for x in items if x["name"].strip().lower() == wanted), None)
-    if not match:
-        return None
-
-    # Fetch RAW body from source (preserves paragraph breaks)
-    raw_body = get_body_by_id_raw(from_list, match["id"])
-
-    # Create in destination and return its ID
-    create_script = r'''
-    on run argv
-      set listName to item 1 of argv
-      set theTitle to item 2 of argv
-      set theBody to item 3 of argv
-      tell application "Reminders"
-        set theList to first list whose name is listName
-        set newRem to make new reminder at end of reminders of theList with properties {name:theTitle, body:theBody}
-        return (id of newRem as text)
-      end tell
-    end run
-    '''
-    new_id = run_as(create_script, to_list, match["name"], raw_body)
-
-    # delete original by ID (robust)
-    delete_by_id(from_list, match["id"])
-    return new_id if (new_id and new_id.strip()) else None
-
-
 
 def advance_on_complete():
-    now = datetime.now()
+    """
+    Advance completed reminders through the cadence. Reminder writes are queued
+    per stage and flushed with one run_as_batch call at the end of each stage.
+    """
+    with _state_txn(), _list_cache_scope():
+        _advance_on_complete(datetime.now())
+
+def _advance_on_complete(now: datetime) -> None:
+    # Loop-invariant date math: computed once per run / per anchor schedule
+    now_weekday = now.weekday()
+    daily_due = next_morning_8am(now)
+    due_memo: Dict[tuple, datetime] = {}
+
+    def anchor_of(rec: dict) -> int:
+        a = rec.get("anchor_weekday")
+        return now_weekday if a is None else a
+
+    def weekly_due(anchor: int) -> datetime:
+        key = ("w", anchor)
+        if key not in due_memo:
+            due_memo[key] = next_same_weekday_8am(anchor, now)
+        return due_memo[key]
+
+    def months_due(anchor: int, months: int) -> datetime:
+        key = ("m", anchor, months)
+        if key not in due_memo:
+            due_memo[key] = next_same_weekday_in_n_months_8am(anchor, now, months)
+        return due_memo[key]
+
+    # One bulk snapshot drives every stage. Reminders moved by an earlier stage arrive
+    # incomplete, so later stages can skip re-listing the lists those moves invalidated.
+    snapshot = _list_many([DAILY, WEEKLY, MONTHLY, MASTERED])
+    # Completed items without state text get fetched by _opportunistic_fill_on_touch
+    prefetch_scripture_texts(_titles_missing_text(
+        [r for items in snapshot.values() for r in items if r["completed"]]))
+
+    def completed_in(ln: str):
+        """Yield (r, title, rec, anchor) for completed reminders, after the shared touch preamble."""
+        items = snapshot[ln] if ln in snapshot else _cached_list_reminders(ln)
+        for r in items:
+            if not r["completed"]:
+                continue
+            _maybe_migrate_state_on_touch(ln, r)  # opportunistic SID-based title migration (no extra I/O)
+            _opportunistic_fill_on_touch(ln, r)
+            rec = _get_or_init_record(r["name"], anchor_weekday=now_weekday)
+            yield r, r["name"], rec, anchor_of(rec)
+
+    def commit(title: str, fields: dict, msg: str, stage: str, action: str, due: datetime, after=None) -> None:
+        """Record one advance whose reminder writes succeeded."""
+        _update_record(title, **fields)
+        if after is not None:
+            after()
+        print(msg)
+        _append_csv_event(title, stage, action, due.strftime('%Y-%m-%d %H:%M'))
+
+    def flush(ops: list, pending: list) -> None:
+        """
+        Run the stage's batch, then commit each item only if all of its ops succeeded.
+        A failed write leaves the reminder completed in its list with its state
+        untouched, so the next run picks it up again instead of double-counting.
+        """
+        results = run_as_batch(ops)
+        for start, end, action in pending:
+            if all(results[start:end]):
+                action()
 
     # ===== Daily stage =====
-    for r in list_reminders(DAILY):
-        if not r["completed"]:
-            continue
-        title = r["name"]
-        _maybe_migrate_state_on_touch(DAILY, r)  # opportunistic SID-based title migration (no extra I/O)
-        _opportunistic_fill_on_touch(DAILY, r)
-        rec = _get_or_init_record(title)
-        anchor = rec.get("anchor_weekday", now.weekday())
-
+    ops: list = []
+    pending: list = []  # (first op, end op, commit callback)
+    for r, title, rec, anchor in completed_in(DAILY):
         if rec.get("stage") not in ("weekly", "monthly", "mastered"):
+            start = len(ops)
             dcount = int(rec.get("daily_count", 0))
             if dcount + 1 < DAILY_REPEATS:
-                due = next_morning_8am(now)  # uses configured time
-                set_due_date(DAILY, r["id"], due)
-                mark_incomplete_by_id(DAILY, r["id"])
-                _update_record(title, stage="daily", daily_count=dcount + 1, anchor_weekday=anchor)
-                print(f"[Daily] Rescheduled {title} for {due.strftime('%m/%d/%Y %H:%M')}; day {dcount+1}/{DAILY_REPEATS}")
-                _append_csv_event(title, "daily", "rescheduled", due.strftime('%Y-%m-%d %H:%M'))
+                due = daily_due  # uses configured time
+                _queue_due(ops, DAILY, r["id"], due)
+                _queue_incomplete(ops, DAILY, r["id"])
+                pending.append((start, len(ops), partial(
+                    commit, title, dict(stage="daily", daily_count=dcount + 1, anchor_weekday=anchor),
+                    f"[Daily] Rescheduled {title} for {due.strftime('%m/%d/%Y %H:%M')}; day {dcount+1}/{DAILY_REPEATS}",
+                    "daily", "rescheduled", due)))
             else:
                 # Move to Weekly
-                new_id = move_by_title(DAILY, WEEKLY, title)
-                wdue = next_same_weekday_8am(anchor, now)  # uses configured time
-                if not new_id:
-                    # Resolve defensively by title if needed
-                    for it2 in list_reminders(WEEKLY):
-                        if _norm_title(it2["name"]) == _norm_title(title):
-                            new_id = it2["id"]; break
-                if new_id:
-                    set_due_date(WEEKLY, new_id, wdue)
-                    mark_incomplete_by_id(WEEKLY, new_id)
-                _update_record(title, stage="weekly", daily_count=DAILY_REPEATS, weekly_count=0, anchor_weekday=anchor)
-                print(f"[Daily→Weekly] {title} scheduled {wdue.strftime('%m/%d/%Y %H:%M')}")
-                _append_csv_event(title, "weekly", "promoted", wdue.strftime('%Y-%m-%d %H:%M'))
+                wdue = weekly_due(anchor)  # uses configured time
+                _queue_move(ops, DAILY, r["id"], WEEKLY, wdue)
+                pending.append((start, len(ops), partial(
+                    commit, title, dict(stage="weekly", daily_count=DAILY_REPEATS, weekly_count=0, anchor_weekday=anchor),
+                    f"[Daily→Weekly] {title} scheduled {wdue.strftime('%m/%d/%Y %H:%M')}",
+                    "weekly", "promoted", wdue)))
+    flush(ops, pending)
 
     # ===== Weekly stage =====
-    for r in list_reminders(WEEKLY):
-        if not r["completed"]:
-            continue
-        title = r["name"]
-        _maybe_migrate_state_on_touch(WEEKLY, r)  # opportunistic SID-based title migration (no extra I/O)
-        _opportunistic_fill_on_touch(WEEKLY, r)
-        rec = _get_or_init_record(title)
-        anchor = rec.get("anchor_weekday", now.weekday())
+    ops, pending = [], []
+    promoted_monthly = []  # note canonicalization needs the reminder to exist in Monthly
+    for r, title, rec, anchor in completed_in(WEEKLY):
+        start = len(ops)
         wcount = int(rec.get("weekly_count", 0))
 
         if wcount + 1 < WEEKLY_REPEATS:
-            wdue = next_same_weekday_8am(anchor, now)
-            set_due_date(WEEKLY, r["id"], wdue)
-            mark_incomplete_by_id(WEEKLY, r["id"])
-            _update_record(title, stage="weekly", weekly_count=wcount + 1, anchor_weekday=anchor)
-            print(f"[Weekly] Rescheduled {title} for {wdue.strftime('%m/%d/%Y %H:%M')}; week {wcount+1}/{WEEKLY_REPEATS}")
-            _append_csv_event(title, "weekly", "rescheduled", wdue.strftime('%Y-%m-%d %H:%M'))
+            wdue = weekly_due(anchor)
+            _queue_due(ops, WEEKLY, r["id"], wdue)
+            _queue_incomplete(ops, WEEKLY, r["id"])
+            pending.append((start, len(ops), partial(
+                commit, title, dict(stage="weekly", weekly_count=wcount + 1, anchor_weekday=anchor),
+                f"[Weekly] Rescheduled {title} for {wdue.strftime('%m/%d/%Y %H:%M')}; week {wcount+1}/{WEEKLY_REPEATS}",
+                "weekly", "rescheduled", wdue)))
         else:
             # Move to Monthly and init monthly_count
-            new_id = move_by_title(WEEKLY, MONTHLY, title)
-            mdue = next_same_weekday_in_n_months_8am(anchor, now, 1)  # still computes 8am-equivalent via configured time later
-            if not new_id:
-                for it2 in list_reminders(MONTHLY):
-                    if _norm_title(it2["name"]) == _norm_title(title):
-                        new_id = it2["id"]; break
-            if new_id:
-                set_due_date(MONTHLY, new_id, mdue)
-                mark_incomplete_by_id(MONTHLY, new_id)
-            _update_record(title, stage="monthly", weekly_count=WEEKLY_REPEATS, monthly_count=0, anchor_weekday=anchor)
-            _ensure_canonical_monthly_note(title, now)
-            if OBF_ENABLED:
-                _roll_obf_salt(title)                  # NEW: new month → new pattern
-                _refresh_monthly_obfuscation(title, now)
-            print(f"[Weekly→Monthly] {title} scheduled {mdue.strftime('%m/%d/%Y %H:%M')}")
-            _append_csv_event(title, "monthly", "promoted", mdue.strftime('%Y-%m-%d %H:%M'))
+            mdue = months_due(anchor, 1)  # still computes 8am-equivalent via configured time later
+            _queue_move(ops, WEEKLY, r["id"], MONTHLY, mdue)
+            pending.append((start, len(ops), partial(
+                commit, title, dict(stage="monthly", weekly_count=WEEKLY_REPEATS, monthly_count=0, anchor_weekday=anchor),
+                f"[Weekly→Monthly] {title} scheduled {mdue.strftime('%m/%d/%Y %H:%M')}",
+                "monthly", "promoted", mdue, partial(promoted_monthly.append, title))))
+    flush(ops, pending)
+    index = _build_title_index() if promoted_monthly else None
+    for title in promoted_monthly:
+        _ensure_canonical_monthly_note(title, now, index=index)
+        if OBF_ENABLED:
+            _roll_obf_salt(title)                  # NEW: new month → new pattern
 
     # ===== Monthly stage =====
-    for r in list_reminders(MONTHLY):
-        if not r["completed"]:
-            continue
-        title = r["name"]
-        _maybe_migrate_state_on_touch(MONTHLY, r)
-        _opportunistic_fill_on_touch(MONTHLY, r)
-        rec = _get_or_init_record(title)
-        anchor = rec.get("anchor_weekday", now.weekday())
+    ops, pending = [], []
+    index = None  # built on first use; note writes don't change titles/lists
+
+    def refresh_monthly_note(title: str) -> None:
+        _ensure_canonical_monthly_note(title, now, index=index)
+        if OBF_ENABLED:
+            _roll_obf_salt(title)                  # NEW: increment month → new pattern
+
+    for r, title, rec, anchor in completed_in(MONTHLY):
+        start = len(ops)
         mcount = int(rec.get("monthly_count", 0)) + 1  # count this completion
 
         if mcount >= MONTHLY_REPEATS:
             # Graduate to Mastered
-            new_id = move_by_title(MONTHLY, MASTERED, title)
             first_gap = MASTERED_REVIEW_MONTHS[0] if MASTERED_REVIEW_MONTHS else MASTERED_YEARLY_INTERVAL
-            due = next_same_weekday_in_n_months_8am(anchor, now, first_gap)
-            if not new_id:
-                for it2 in list_reminders(MASTERED):
-                    if _norm_title(it2["name"]) == _norm_title(title):
-                        new_id = it2["id"]; break
-            if new_id:
-                set_due_date(MASTERED, new_id, due)
-                mark_incomplete_by_id(MASTERED, new_id)
-            _update_record(title, stage="mastered", monthly_count=mcount, mastered_count=0, anchor_weekday=anchor)
-            print(f"[Monthly→Mastered] {title} graduated after {MONTHLY_REPEATS} monthly reviews; next check {due.strftime('%m/%d/%Y %H:%M')}")
-            _append_csv_event(title, "mastered", "promoted", due.strftime('%Y-%m-%d %H:%M'))
+            due = months_due(anchor, first_gap)
+            _queue_move(ops, MONTHLY, r["id"], MASTERED, due)
+            pending.append((start, len(ops), partial(
+                commit, title, dict(stage="mastered", monthly_count=mcount, mastered_count=0, anchor_weekday=anchor),
+                f"[Monthly→Mastered] {title} graduated after {MONTHLY_REPEATS} monthly reviews; next check {due.strftime('%m/%d/%Y %H:%M')}",
+                "mastered", "promoted", due)))
         else:
-            # Stay Monthly
-            due = next_same_weekday_in_n_months_8am(anchor, now, 1)
-            set_due_date(MONTHLY, r["id"], due)
-            mark_incomplete_by_id(MONTHLY, r["id"])
-            _update_record(title, stage="monthly", monthly_count=mcount, anchor_weekday=anchor)
-            _ensure_canonical_monthly_note(title, now)
-            if OBF_ENABLED:
-                _roll_obf_salt(title)                  # NEW: increment month → new pattern
-                _refresh_monthly_obfuscation(title, now)
-            print(f"[Monthly] Rescheduled {title} for {due.strftime('%m/%d/%Y %H:%M')} ({mcount}/{MONTHLY_REPEATS})")
-            _append_csv_event(title, "monthly", "rescheduled", due.strftime('%Y-%m-%d %H:%M'))
+            # Stay Monthly; the title index is taken before the batch invalidates Monthly
+            due = months_due(anchor, 1)
+            _queue_due(ops, MONTHLY, r["id"], due)
+            _queue_incomplete(ops, MONTHLY, r["id"])
+            if index is None:
+                index = _build_title_index()
+            pending.append((start, len(ops), partial(
+                commit, title, dict(stage="monthly", monthly_count=mcount, anchor_weekday=anchor),
+                f"[Monthly] Rescheduled {title} for {due.strftime('%m/%d/%Y %H:%M')} ({mcount}/{MONTHLY_REPEATS})",
+                "monthly", "rescheduled", due, partial(refresh_monthly_note, title))))
+    flush(ops, pending)
 
     # ===== Mastered stage =====
-    for r in list_reminders(MASTERED):
-        if not r["completed"]:
-            continue
-        title = r["name"]
-        _maybe_migrate_state_on_touch(MASTERED, r) # opportunistic SID-based title migration (no extra I/O)
-        _opportunistic_fill_on_touch(MASTERED, r)
-        rec = _get_or_init_record(title)
-        anchor = rec.get("anchor_weekday", now.weekday())
+    ops, pending = [], []
+    if not _MASTERED_GAPS:
+        _rebuild_mastered_gaps()
+    for r, title, rec, anchor in completed_in(MASTERED):
+        start = len(ops)
         k = int(rec.get("mastered_count", 0)) + 1  # increment mastered completions
 
-        if k < 1:
-            gap = MASTERED_REVIEW_MONTHS[0] if MASTERED_REVIEW_MONTHS else MASTERED_YEARLY_INTERVAL
-        elif k <= len(MASTERED_REVIEW_MONTHS):
-            gap = MASTERED_REVIEW_MONTHS[k - 1]
-        else:
-            gap = MASTERED_YEARLY_INTERVAL
+        gap = _MASTERED_GAPS[max(k, 0)] if k < len(_MASTERED_GAPS) else MASTERED_YEARLY_INTERVAL
 
-        due = next_same_weekday_in_n_months_8am(anchor, now, gap)
-        set_due_date(MASTERED, r["id"], due)
-        mark_incomplete_by_id(MASTERED, r["id"])
-        _update_record(title, stage="mastered", mastered_count=k, anchor_weekday=anchor)
+        due = months_due(anchor, gap)
+        _queue_due(ops, MASTERED, r["id"], due)
+        _queue_incomplete(ops, MASTERED, r["id"])
         schedule_label = f"next in {gap} mo" if k <= len(MASTERED_REVIEW_MONTHS) else "next yearly"
-        print(f"[Mastered] Rescheduled {title} ({schedule_label}); completed {k} mastered review(s)")
-        _append_csv_event(title, "mastered", "rescheduled", due.strftime('%Y-%m-%d %H:%M'))
+        pending.append((start, len(ops), partial(
+            commit, title, dict(stage="mastered", mastered_count=k, anchor_weekday=anchor),
+            f"[Mastered] Rescheduled {title} ({schedule_label}); completed {k} mastered review(s)",
+            "mastered", "rescheduled", due)))
+    flush(ops, pending)
 
 
 def _opportunistic_fill_on_touch(list_name: str, item: dict) -> bool:
     """
     If state.full_text is missing for this title, fetch and cache it, then rebuild the note
-    (unless #manual_override appears in the sanitized body). Returns True if a rewrite occurred.
-    - Uses ONLY the sanitized body from list_reminders() to detect #manual_override (no raw read).
+    (unless #manual_override appears in the listed body). Returns True if a rewrite occurred.
+    - Uses ONLY the body from list_reminders() to detect #manual_override (no raw read).
     - Writes note only if we fetched text and need to canonicalize.
     """
     title = (item.get("name") or "").strip()
     if not title:
         return False
 
-    # Respect manual override (check sanitized body—marker still matches)
+    # Respect manual override (listed body is raw)
     body_flat = (item.get("body") or "")
-    if "#manual_override" in body_flat.casefold():
+    if _contains_manual_override(body_flat):
         return False
 
     rec = _get_or_init_record(title)
@@ -1526,7 +2306,7 @@ def _opportunistic_fill_on_touch(list_name: str, item: dict) -> bool:
     if not txt:
         return False
 
-    _update_record(title, full_text=txt, full_text_sha=_sha1(txt))
+    _update_record(title, full_text=txt, full_text_sha=_fingerprint(txt))
 
     # Rebuild the note in-place
     if list_name == MONTHLY:
@@ -1535,7 +2315,10 @@ def _opportunistic_fill_on_touch(list_name: str, item: dict) -> bool:
             _ensure_sid_for_title(MONTHLY, title)
         return bool(ok)
     else:
-        ok = ensure_notes_for(list_name, title)
+        if item.get("id"):
+            ok = ensure_notes_for_by_id(list_name, item["id"], title, raw_body=body_flat)
+        else:
+            ok = ensure_notes_for(list_name, title)
         if ok:
             _ensure_sid_for_title(list_name, title)
         return bool(ok)
@@ -1547,30 +2330,56 @@ def _weekday_name(ix: int) -> str:
     except Exception:
         return "?"
 
-def _find_item_across_lists(title: str):
+def _build_title_index() -> Dict[str, tuple]:
+    """
+    {normalized title: (list_name, item)}; first list/item wins, same order as _find_item_across_lists.
+    Inside a _list_cache_scope() the index is kept until a list is invalidated.
+    """
+    global _TITLE_INDEX
+    if _LIST_CACHE_DEPTH and _TITLE_INDEX is not None:
+        return _TITLE_INDEX
+    index: Dict[str, tuple] = {}
+    lists = [DAILY, WEEKLY, MONTHLY, MASTERED, BACKLOG]
+    if _LIST_CACHE_DEPTH:
+        _list_many(lists)  # one osascript call for whatever isn't cached yet
+    for ln in lists:
+        for it in _cached_list_reminders(ln):
+            index.setdefault(_norm_title(it["name"]), (ln, it))
+    if _LIST_CACHE_DEPTH:
+        _TITLE_INDEX = index
+    return index
+
+def _find_item_across_lists(title: str, index: Optional[dict] = None):
+    if index is None and _LIST_CACHE_DEPTH:
+        index = _build_title_index()
+    if index is not None:
+        return index.get(_norm_title(title), (None, None))
+    want = _norm_title(title)
     for ln in [DAILY, WEEKLY, MONTHLY, MASTERED, BACKLOG]:
-        items = list_reminders(ln)
+        items = _cached_list_reminders(ln)
         for it in items:
-            if _norm_title(it["name"]) == _norm_title(title):
+            if _norm_title(it["name"]) == want:
                 return (ln, it)
     return (None, None)
 
 def print_status():
+    with _list_cache_scope():
+        _print_status()
+
+def _print_status():
     state = _load_state()
     recs = state.get("verses", {})
 
-    all_items = []
-    for ln in [DAILY, WEEKLY, MONTHLY, MASTERED, BACKLOG]:
-        try:
-            for it in list_reminders(ln):
-                all_items.append((ln, it))
-        except Exception:
-            pass
+    order = [DAILY, WEEKLY, MONTHLY, MASTERED, BACKLOG]
+    lists = _list_many(order)
+    all_items = [(ln, it) for ln in order for it in lists.get(ln, [])]
     idx = {_norm_title(it["name"]): (ln, it) for (ln, it) in all_items}
 
-    print("\n=== STATUS ===============================================")
-    print("Title                                 | Stage     | D/W/M/M* | Anchor | List       | Completed | Due")
-    print("----------------------------------------------------------+-----------+------------+--------+------------+-----------+------------------------------")
+    lines = []
+    out = lines.append
+    out("\n=== STATUS ===============================================")
+    out("Title                                 | Stage     | D/W/M/M* | Anchor | List       | Completed | Due")
+    out("----------------------------------------------------------+-----------+------------+--------+------------+-----------+------------------------------")
 
     def fmt_counts(rec: dict) -> str:
         d = int(rec.get("daily_count", 0))
@@ -1582,68 +2391,78 @@ def print_status():
     tracked_keys = set()
     for key, rec in sorted(recs.items(), key=lambda kv: kv[1].get("title","")):
         title = rec.get("title") or ""
-        tracked_keys.add(_norm_title(title))
+        tkey = _norm_title(title)
+        tracked_keys.add(tkey)
         stage = (rec.get("stage") or "?").ljust(9)
         counts = fmt_counts(rec).ljust(10)
         anchor = _weekday_name(rec.get("anchor_weekday", 0)).ljust(6)
 
-        ln, it = idx.get(_norm_title(title), (None, None))
+        ln, it = idx.get(tkey, (None, None))
         list_name   = (ln or "-").ljust(10)
         completed   = ("True" if (it and it.get("completed")) else "False").ljust(9)
         due_display = (it.get("due") if it else "(missing)").strip() if it else "(missing)"
 
         tcol = (title[:35] + "…") if len(title) > 36 else title.ljust(36)
-        print(f"{tcol} | {stage} | {counts} | {anchor} | {list_name} | {completed} | {due_display}")
+        out(f"{tcol} | {stage} | {counts} | {anchor} | {list_name} | {completed} | {due_display}")
 
-    orphan_titles = []
-    for (ln, it) in all_items:
-        if _norm_title(it["name"]) not in tracked_keys:
-            orphan_titles.append((ln, it))
+    # Set differences over already-normalized keys (kept in list/state order)
+    orphan_keys = idx.keys() - tracked_keys
+    orphan_titles = [v for k, v in idx.items() if k in orphan_keys]
 
     if orphan_titles:
-        print("\nOrphans (exist in Reminders but not in state):")
+        out("\nOrphans (exist in Reminders but not in state):")
         for (ln, it) in orphan_titles:
-            print(f"  - [{ln}] {it['name']} | completed={it['completed']} | due={it['due']!r}")
+            out(f"  - [{ln}] {it['name']} | completed={it['completed']} | due={it['due']!r}")
 
-    stale = [recs[k]["title"] for k in recs.keys() if k not in idx]
+    stale_keys = recs.keys() - idx.keys()
+    stale = [rec["title"] for k, rec in recs.items() if k in stale_keys]
     if stale:
-        print("\nStale (tracked in state but missing from Reminders):")
+        out("\nStale (tracked in state but missing from Reminders):")
         for t in stale:
-            print(f"  - {t}")
+            out(f"  - {t}")
 
-    print("===========================================================\n")
+    out("===========================================================\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ====================================================================
 # Debug / utilities
 # ====================================================================
 def debug_dump():
-    for ln in [DAILY, WEEKLY, MONTHLY, BACKLOG, MASTERED]:
-        items = list_reminders(ln)
+    order = [DAILY, WEEKLY, MONTHLY, BACKLOG, MASTERED]
+    lists = _list_many(order)
+    for ln in order:
+        items = lists.get(ln, [])
         print(f"\n== {ln} ==")
         for it in items:
             print(f"  - {it['name']}  | completed={it['completed']}  | due={it['due']!r}")
 
 def dump_state():
+    # state.json is stored compact; pretty-print only for display
     try:
         with open(STATE_PATH, "r", encoding="utf-8") as f:
-            print(f"\n[STATE] {STATE_PATH}\n" + f.read())
+            state = json.load(f)
     except Exception:
         print("\n[STATE] (no state file yet)")
+        return
+    print(f"\n[STATE] {STATE_PATH}\n" + json.dumps(state, indent=2, ensure_ascii=False))
 
+@_with_state_txn
 def fill_notes_for_daily():
     """
     Fill notes for Daily if blank (state-first; API fallback),
-    then ensure a SID for any item we actually filled,
-    and cache full_text in state from the note.
+    then ensure a SID for any item we actually filled.
+    (ensure_notes_for_by_id already stores the text it writes in state.full_text.)
     """
     filled = 0
     now = datetime.now()
     sid_added = 0
-    for it in list_reminders(DAILY):
+    items = _cached_list_reminders(DAILY)
+    prefetch_scripture_texts(_titles_missing_text(items, blank_only=True))
+    for it in items:
         try:
             if not (it["body"] or "").strip():
-                if ensure_notes_for_by_id(DAILY, it["id"], it["name"]):
+                if ensure_notes_for_by_id(DAILY, it["id"], it["name"], raw_body=it["body"] or ""):
                     filled += 1
                     _ensure_due_for_list(DAILY, it, now)
                     _maybe_migrate_state_on_touch(DAILY, it)
@@ -1651,23 +2470,24 @@ def fill_notes_for_daily():
                     sid = _ensure_sid_for_title(DAILY, it["name"])
                     if sid:
                         sid_added += 1
-                    _ingest_full_text_from_note(DAILY, it["id"], it["name"])
         except Exception as e:
             print(f"[daily] fill-notes error for '{it.get('name','?')}': {e}")
     print(f"Filled notes for {filled} item(s) in Daily; ensured SID on {sid_added}.")
 
 
+@_with_state_txn
 def fill_notes_for_weekly():
-    """Fill notes for Weekly if blank, then attach SID and cache full_text in state."""
+    """Fill notes for Weekly if blank (text is cached in state by the fill), then attach SID."""
     filled = 0
     now = datetime.now()
-    for it in list_reminders(WEEKLY):
+    items = _cached_list_reminders(WEEKLY)
+    prefetch_scripture_texts(_titles_missing_text(items, blank_only=True))
+    for it in items:
         try:
             if not (it["body"] or "").strip():
-                if ensure_notes_for_by_id(WEEKLY, it["id"], it["name"]):
+                if ensure_notes_for_by_id(WEEKLY, it["id"], it["name"], raw_body=it["body"] or ""):
                     filled += 1
                     _ensure_sid_for_title(WEEKLY, it["name"])
-                    _ingest_full_text_from_note(WEEKLY, it["id"], it["name"])
                     _ensure_due_for_list(WEEKLY, it, now)
                     _maybe_migrate_state_on_touch(WEEKLY, it)
                     _opportunistic_fill_on_touch(WEEKLY, it)
@@ -1675,17 +2495,19 @@ def fill_notes_for_weekly():
             print(f"[weekly] fill-notes error for '{it.get('name','?')}': {e}")
     print(f"Filled notes for {filled} item(s) in Weekly.")
 
+@_with_state_txn
 def fill_notes_for_monthly():
-    """Fill notes for Monthly if blank, then attach SID, cache full_text, and canonicalize with obfuscation."""
+    """Fill notes for Monthly if blank, then attach SID and canonicalize with obfuscation."""
     filled = 0
     now = datetime.now()
-    for it in list_reminders(MONTHLY):
+    items = _cached_list_reminders(MONTHLY)
+    prefetch_scripture_texts(_titles_missing_text(items, blank_only=True))
+    for it in items:
         try:
             if not (it["body"] or "").strip():
-                if ensure_notes_for_by_id(MONTHLY, it["id"], it["name"]):
+                if ensure_notes_for_by_id(MONTHLY, it["id"], it["name"], raw_body=it["body"] or ""):
                     filled += 1
                     _ensure_sid_for_title(MONTHLY, it["name"])
-                    _ingest_full_text_from_note(MONTHLY, it["id"], it["name"])
                     _ensure_due_for_list(MONTHLY, it, now)
                     _ensure_canonical_monthly_note(it["name"], now)
                     _maybe_migrate_state_on_touch(MONTHLY, it)
@@ -1705,12 +2527,9 @@ def cli_test_fetch(ref: str) -> None:
         print("... (truncated)")
 
 def existing_refs_across_all_lists() -> list[str]:
-    titles = []
-    for ln in [DAILY, WEEKLY, MONTHLY, BACKLOG]:
-        try:
-            titles += [x["name"] for x in list_reminders(ln)]
-        except Exception:
-            pass
+    order = [DAILY, WEEKLY, MONTHLY, BACKLOG]
+    lists = _list_many(order)
+    titles = [x["name"] for ln in order for x in lists.get(ln, [])]
     seen = set()
     out = []
     for t in titles:
@@ -1742,6 +2561,7 @@ def ensure_all_lists() -> None:
         ok = ensure_list_exists(ln)
         print(f"[setup] {( 'OK ' if ok else 'ERR')}  {ln}")
 
+@_with_state_txn
 def doctor():
     """
     Doctor checks:
@@ -1785,69 +2605,74 @@ def doctor():
         print("[state] WARN  could not read state file")
 
     # Fix mode?
-    fix_mode = any(arg.strip() == "--fix" for arg in sys.argv[2:])
+    fix_mode = "--fix" in sys.argv[2:]
     if not fix_mode:
         print("=== doctor done (no --fix) ===\n")
         return
 
     print("\n=== doctor --fix repairs ===")
-    # Fill missing note content first (prevents SID-only notes)
-    for ln in (DAILY, WEEKLY, MONTHLY):
+    # One list-cache scope for all repair passes: lists are fetched once (bulk) and
+    # every pass sees the bodies earlier passes wrote
+    with _list_cache_scope():
+        _list_many((DAILY, WEEKLY, MONTHLY))
+        # Fill missing note content first (prevents SID-only notes)
+        for ln in (DAILY, WEEKLY, MONTHLY):
+            try:
+                for it in _cached_list_reminders(ln):
+                    if not (it.get("body") or "").strip():
+                        _refresh_text_and_note(ln, it)
+            except Exception as e:
+                print(f"[fix] fill-missing {ln} ERROR: {e}")
+        # Canonicalize non-blank, non-manual Daily/Weekly notes
         try:
-            for it in list_reminders(ln):
-                if not (it.get("body") or "").strip():
-                    _refresh_text_and_note(ln, it)
+            rew = _doctor_canonicalize_nonmonthly_notes()
+            print(f"[fix] Canonicalized Daily/Weekly notes: {rew}")
         except Exception as e:
-            print(f"[fix] fill-missing {ln} ERROR: {e}")
-    # Canonicalize non-blank, non-manual Daily/Weekly notes
-    try:
-        rew = _doctor_canonicalize_nonmonthly_notes()
-        print(f"[fix] Canonicalized Daily/Weekly notes: {rew}")
-    except Exception as e:
-        print(f"[fix] canonicalize ERROR: {e}")
+            print(f"[fix] canonicalize ERROR: {e}")
 
-       # Repair any legacy SID-only notes
-    try:
-        repaired = 0
+           # Repair any legacy SID-only notes
+        try:
+            repaired = 0
+            for ln in (DAILY, WEEKLY, MONTHLY):
+                repaired += _repair_sid_only_notes_for_list(ln)
+            print(f"[fix] Repaired SID-only notes: {repaired}")
+        except Exception as e:
+            print(f"[fix] SID-only repair ERROR: {e}")
+
+
+        # A) SID sweep
+        total_added = 0
         for ln in (DAILY, WEEKLY, MONTHLY):
-            repaired += _repair_sid_only_notes_for_list(ln)
-        print(f"[fix] Repaired SID-only notes: {repaired}")
-    except Exception as e:
-        print(f"[fix] SID-only repair ERROR: {e}")
- 
+            try:
+                added = sid_sweep_for_list(ln)
+                print(f"[fix] SID sweep {ln}: +{added}")
+                total_added += added
+            except Exception as e:
+                print(f"[fix] SID sweep {ln} ERROR: {e}")
+        _append_log(f"doctor --fix: SID sweep added {total_added} SID(s)")
 
-    # A) SID sweep
-    total_added = 0
-    for ln in (DAILY, WEEKLY, MONTHLY):
+        # B) Title-change repair (SID-anchored)
         try:
-            added = sid_sweep_for_list(ln)
-            print(f"[fix] SID sweep {ln}: +{added}")
-            total_added += added
+            migrated = _doctor_title_change_repair()
+            print(f"[fix] Title-change repairs (SID-anchored): {migrated}")
+            _append_log(f"doctor --fix: title-change repairs {migrated}")
         except Exception as e:
-            print(f"[fix] SID sweep {ln} ERROR: {e}")
-    _append_log(f"doctor --fix: SID sweep added {total_added} SID(s)")
-
-    # B) Title-change repair (SID-anchored)
-    try:
-        migrated = _doctor_title_change_repair()
-        print(f"[fix] Title-change repairs (SID-anchored): {migrated}")
-        _append_log(f"doctor --fix: title-change repairs {migrated}")
-    except Exception as e:
-        print(f"[fix] Title-change repair ERROR: {e}")
+            print(f"[fix] Title-change repair ERROR: {e}")
 
     print("=== doctor --fix done ===\n")
 
 def _doctor_title_change_repair() -> int:
     """
-    Sweep Daily/Weekly/Monthly using sanitized bodies only.
+    Sweep Daily/Weekly/Monthly using listed bodies only.
     For any item whose SID maps to a *different* title in state, migrate the record
     to the current title and refresh canonical text for that new title, rebuilding the note.
     Returns count of migrations performed.
     """
     migrated = 0
+    lists = _list_many((DAILY, WEEKLY, MONTHLY))
     for ln in (DAILY, WEEKLY, MONTHLY):
         try:
-            for it in list_reminders(ln):
+            for it in lists.get(ln, []):
                 sid = _extract_sid_from_text(it.get("body",""))
                 if not sid:
                     continue
@@ -1870,9 +2695,11 @@ def _doctor_canonicalize_nonmonthly_notes() -> int:
     rewritten = 0
     for ln in (DAILY, WEEKLY):
         try:
-            for it in list_reminders(ln):
-                # Read RAW body to check manual flag and compare precisely
-                raw = get_body_by_id_raw(ln, it["id"])
+            items = _cached_list_reminders(ln)
+            index = _index_by_title(items)
+            for it in items:
+                # Listed bodies are raw: check manual flag and compare precisely
+                raw = it.get("body") or ""
                 if not raw.strip():
                     continue  # blank handled elsewhere
                 if _contains_manual_override(raw):
@@ -1889,10 +2716,10 @@ def _doctor_canonicalize_nonmonthly_notes() -> int:
                     canonical = (fetch_scripture_text(title) or "").strip()
                     if not canonical:
                         continue
-                    _update_record(title, full_text=canonical, full_text_sha=_sha1(canonical))
+                    _update_record(title, full_text=canonical, full_text_sha=_fingerprint(canonical))
 
                 # Preserve/ensure SID
-                sid = _extract_sid(raw) or rec.get("sid") or _ensure_sid_for_title(ln, title)
+                sid = _extract_sid(raw) or rec.get("sid") or _ensure_sid_for_title(ln, title, index)
                 new_body = _append_sid(canonical, sid)
 
                 if raw.strip() != new_body.strip():
@@ -1906,6 +2733,9 @@ def _doctor_canonicalize_nonmonthly_notes() -> int:
 # ====================================================================
 # Verse Obfuscation helpers (UNIFIED)
 # ====================================================================
+# Bracketed UUID tags such as [sid:...]
+_UUID_TAG_RE = re.compile(r"\[[^\[\]\n\r:]{1,16}:[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}\]")
+
 def _extract_full_text(note: str) -> str:
     """
     Extract canonical FULL ORIGINAL TEXT from a note:
@@ -1915,47 +2745,62 @@ def _extract_full_text(note: str) -> str:
       - Trim leading dot-buffer/blank lines and trailing blank lines.
     If no separator exists, return full note minus UUID tokens/extra spacer lines.
     """
-    sep = globals().get("OBF_SEPARATOR", "\n\n______________________________\n")
-    buf_token = str(globals().get("OBF_BUFFER_TOKEN", "."))
-    s = (note or "")
+    sep = OBF_SEPARATOR
+    buf_token = OBF_BUFFER_TOKEN
 
     # Remove any bracketed UUID tags anywhere (e.g., [sid:...])
-    rm_uuid_tags = lambda text: re.sub(
-        r"\[[^\[\]\n\r:]{1,16}:[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}\]",
-        "",
-        text,
-    )
-
-    s = rm_uuid_tags(s).strip()
-
-    # Isolate tail after final separator (handle legacy multiple separators)
-    if sep in s:
-        tail = s.rsplit(sep, 1)[1]
-        if sep in tail:
-            tail = tail.rsplit(sep, 1)[1]
-    else:
-        tail = s
-
-    tail = rm_uuid_tags(tail)
+    s = note or ""
+    if "[" in s:
+        s = _UUID_TAG_RE.sub("", s)
+    s = s.strip()
 
-    # Trim leading dot-buffer/blank lines and trailing blanks
-    lines = tail.splitlines()
-    i = 0
-    while i < len(lines) and (not lines[i].strip() or lines[i].strip() == buf_token):
-        i += 1
-    j = len(lines)
-    while j > i and not lines[j - 1].strip():
-        j -= 1
+    # Isolate tail after the final separator (rfind also covers legacy duplicates)
+    idx = s.rfind(sep) if sep else -1
+    tail = s[idx + len(sep):] if idx >= 0 else s
 
-    return "\n".join(lines[i:j]).strip()
+    # Trim surrounding blanks, then any leading dot-buffer lines
+    tail = tail.strip()
+    while tail and tail.startswith(buf_token):
+        nl = tail.find("\n")
+        first = tail if nl < 0 else tail[:nl]
+        if first.strip() != buf_token:
+            break
+        tail = "" if nl < 0 else tail[nl + 1:].lstrip()
+    return tail
 
 
 
 
 # Word regex and obfuscation
 _WORD_RE = re.compile(r"[A-Za-z][A-Za-z’']*")
+# _WORD_RE words are ASCII letters plus apostrophes, so masking maps letters only
+_ALPHA_TO_UNDERSCORE = str.maketrans({c: "_" for c in string.ascii_letters})
+_ALPHA_TO_UNDERSCORE_B = bytes.maketrans(string.ascii_letters.encode(), b"_" * len(string.ascii_letters))
 
-_WORD_RE = re.compile(r"[A-Za-z][A-Za-z’']*")
+@lru_cache(maxsize=8)
+def _eligible_word_re(min_len: int):
+    """Pattern whose group 1 is exactly the _WORD_RE words with >= min_len letters.
+
+    The lookbehind plus leading-apostrophe run anchors matches at _WORD_RE word
+    starts, so short words are skipped inside the regex engine.
+    """
+    return re.compile(
+        r"(?<![A-Za-z’'])[’']*([A-Za-z](?:[’']*[A-Za-z]){%d}[A-Za-z’']*)" % (max(1, min_len) - 1)
+    )
+
+@lru_cache(maxsize=256)
+def _eligible_spans(full_text: str, min_len: int) -> tuple:
+    """
+    (starts, ends) arrays of words with >= min_len letters, in text order.
+    Cached per process (a verse is re-obfuscated each month); callers must not mutate them.
+    """
+    starts = array("i")
+    ends = array("i")
+    for m in _eligible_word_re(min_len).finditer(full_text):
+        s0, e0 = m.span(1)
+        starts.append(s0)
+        ends.append(e0)
+    return starts, ends
 
 def _obfuscate_text(full_text: str, visible_ratio: float, seed: int) -> str:
     """
@@ -1968,53 +2813,79 @@ def _obfuscate_text(full_text: str, visible_ratio: float, seed: int) -> str:
     if vis >= 0.999:
         return full_text
 
-    min_len = int(globals().get("OBF_MIN_LEN", 3))
-    keep_first_last = bool(globals().get("OBF_KEEP_FL", False))
-
-    # Gather eligible word spans using global _WORD_RE
-    spans = []
-    for m in _WORD_RE.finditer(full_text):
-        w = m.group(0)
-        letters = sum(1 for c in w if c.isalpha())
-        if letters >= min_len:
-            spans.append((m.start(), m.end(), w))
-    if not spans:
+    keep_first_last = OBF_KEEP_FL
+
+    # Eligible word spans as parallel arrays (no per-word tuples)
+    starts, ends = _eligible_spans(full_text, OBF_MIN_LEN)
+    n = len(starts)
+    if not n:
         return full_text
 
     blank_frac = 1.0 - vis
-    k = int(round(blank_frac * len(spans)))
+    k = int(round(blank_frac * n))
     if k <= 0:
         return full_text
 
     rnd = random.Random(seed)
-    to_blank = set(rnd.sample(range(len(spans)), k))
-
+    picked = sorted(rnd.sample(range(n), k))
+
+    # ASCII text: byte offsets equal char offsets, so mask spans in place in one buffer
+    if full_text.isascii():
+        buf = bytearray(full_text.encode("ascii"))
+        trim = 1 if keep_first_last else 0
+        for idx in picked:
+            s0, e0 = starts[idx], ends[idx]
+            if e0 - s0 >= 2:
+                s0 += trim
+                e0 -= trim
+            buf[s0:e0] = buf[s0:e0].translate(_ALPHA_TO_UNDERSCORE_B)
+        return buf.decode("ascii")
+
+    # Walk only the blanked words; visible text between them is copied as one slice
     out = []
     last = 0
-    for idx, (s0, e0, w) in enumerate(spans):
+    for idx in picked:
+        s0, e0 = starts[idx], ends[idx]
+        w = full_text[s0:e0]
         out.append(full_text[last:s0])
-        if idx in to_blank:
-            if keep_first_last and len(w) >= 2:
-                core = "".join("_" if c.isalpha() else c for c in w[1:-1])
-                masked = w[0] + core + w[-1]
-            else:
-                masked = "".join("_" if c.isalpha() else c for c in w)
-            out.append(masked)
+        if keep_first_last and len(w) >= 2:
+            out.append(w[0] + w[1:-1].translate(_ALPHA_TO_UNDERSCORE) + w[-1])
         else:
-            out.append(w)
+            out.append(w.translate(_ALPHA_TO_UNDERSCORE))
         last = e0
     out.append(full_text[last:])
     return "".join(out)
 
 
 
+# Mastered gap in months per mastered completion k: [k<1 → first gap, *review_months];
+# k past the end → MASTERED_YEARLY_INTERVAL. Rebuilt by apply_config
+_MASTERED_GAPS: List[int] = []
+
+def _rebuild_mastered_gaps() -> None:
+    global _MASTERED_GAPS
+    first = MASTERED_REVIEW_MONTHS[0] if MASTERED_REVIEW_MONTHS else MASTERED_YEARLY_INTERVAL
+    _MASTERED_GAPS = [first, *MASTERED_REVIEW_MONTHS]
+
+# Visible ratio per monthly_count (0..MONTHLY_REPEATS); rebuilt by apply_config
+_RATIO_TABLE: List[float] = []
+
+def _rebuild_ratio_table() -> None:
+    global _RATIO_TABLE
+    _RATIO_TABLE = [_compute_ratio(i) for i in range(max(0, MONTHLY_REPEATS) + 1)]
+
 def _ratio_for_monthly_count(mcount: int) -> float:
+    if not _RATIO_TABLE:
+        _rebuild_ratio_table()
+    return _RATIO_TABLE[min(max(int(mcount), 0), len(_RATIO_TABLE) - 1)]
+
+def _compute_ratio(mcount: int) -> float:
     """
     Interpolate visible ratio across OBF_SCHEDULE over MONTHLY_REPEATS.
     Robust to any schedule length; returns last value at the end.
     """
-    schedule = list(globals().get("OBF_SCHEDULE", [1.0, 0.75, 0.5, 0.35, 0.2]))
-    repeats = int(globals().get("MONTHLY_REPEATS", 24))
+    schedule = OBF_SCHEDULE
+    repeats = MONTHLY_REPEATS
     if not schedule:
         return 1.0
     if len(schedule) == 1:
@@ -2032,6 +2903,19 @@ def _ratio_for_monthly_count(mcount: int) -> float:
     return a * (1.0 - frac) + b * frac
 
 
+# Constant middle of the Monthly note (buffer + separator); rebuilt by apply_config
+_OBF_SCAFFOLD: Optional[str] = None
+
+def _rebuild_obf_scaffold() -> None:
+    global _OBF_SCAFFOLD
+    buffer_block = "\n".join(OBF_BUFFER_TOKEN for _ in range(max(0, OBF_BUFFER_LINES)))
+    parts = [""]
+    if buffer_block:
+        parts.append(buffer_block)
+    parts.append(OBF_SEPARATOR.rstrip("\n"))
+    parts.append("")
+    _OBF_SCAFFOLD = "\n\n".join(parts)
+
 def _note_with_obfuscation(full_text: str, visible_ratio: float, seed: int) -> str:
     """
     Canonical Monthly note (NO SID here):
@@ -2045,71 +2929,47 @@ def _note_with_obfuscation(full_text: str, visible_ratio: float, seed: int) -> s
       ______________________________
       [FULL ORIGINAL TEXT]
     """
-    obf = _obfuscate_text(full_text.strip(), visible_ratio, seed)
-
-    buf_lines = int(globals().get("OBF_BUFFER_LINES", 4))
-    buf_token = str(globals().get("OBF_BUFFER_TOKEN", "."))
-    sep = globals().get("OBF_SEPARATOR", "\n\n______________________________\n")
-
-    buffer_block = "\n".join(buf_token for _ in range(max(0, buf_lines)))
-    parts = [obf]
-    if buffer_block:
-        parts.append(buffer_block)
-    parts.append(sep.rstrip("\n"))
-    parts.append(full_text.strip())
+    full = full_text.strip()
+    obf = _obfuscate_text(full, visible_ratio, seed)
+    if _OBF_SCAFFOLD is None:
+        _rebuild_obf_scaffold()
+    return f"{obf}{_OBF_SCAFFOLD}{full}".rstrip()
 
-    return "\n\n".join(parts).rstrip()
-
-
-def _weekly_seed_for(title: str, now: datetime) -> int:
-    iso_year, iso_week, _ = now.isocalendar()
-    return hash((title.casefold(), iso_year, iso_week)) & 0x7FFFFFFF
 
 def _monthly_seed(title: str, rec: dict) -> int:
     sid = rec.get("sid") or title
     mcount = int(rec.get("monthly_count", 0))
-    h = hashlib.sha1(f"{sid}|m|{mcount}".encode("utf-8")).hexdigest()[:8]
-    return int(h, 16)
-
-def _ensure_dual_note_for_monthly(title: str, now: datetime) -> bool:
-    """
-    Legacy helper; now delegates to the canonical Monthly note builder to avoid
-    producing a second (duplicated) layout.
-    """
-    return _ensure_canonical_monthly_note(title, now)
-
-
-def _refresh_monthly_obfuscation(title: str, now: datetime) -> None:
-    """
-    Single source of truth: delegate to the canonical Monthly builder.
-    This avoids a second rewrite that used to duplicate sections.
-    """
-    try:
-        _ensure_canonical_monthly_note(title, now)
-    except Exception as e:
-        _append_log(f"[obfuscate] ERROR for '{title}': {e}")
-
+    # Same value as int(hexdigest()[:8], 16), without the hex round-trip
+    return int.from_bytes(hashlib.sha1(f"{sid}|m|{mcount}".encode("utf-8")).digest()[:4], "big")
 
-def _resolve_full_text_for(title: str, list_name: str, rem_id: str) -> Optional[str]:
+def _resolve_full_text_for(title: str, list_name: str, rem_id: str,
+                           note_raw: Optional[str] = None) -> Optional[str]:
+    """State text, else text parsed from the note (pass note_raw if already read), else API."""
     rec = _get_or_init_record(title)
     ft = (rec.get("full_text") or "").strip()
     if ft:
         return ft
 
-    try:
-        note_raw = get_body_by_id_raw(list_name, rem_id)
-    except Exception:
-        note_raw = ""
+    if note_raw is None:
+        try:
+            note_raw = get_body_by_id_raw(list_name, rem_id)
+        except Exception:
+            note_raw = ""
     ft = _extract_full_text(note_raw).strip()
     if not ft:
         ft = fetch_scripture_text(title) or ""
     if not ft:
         return None
 
-    _update_record(title, full_text=ft, full_text_sha=_sha1(ft))
+    _update_record(title, full_text=ft, full_text_sha=_fingerprint(ft))
     return ft
 
-def _ensure_canonical_monthly_note(title: str, now: datetime) -> bool:
+def _monthly_note_sig(rem_id: str, full: str, ratio: float, seed: int, sid: str) -> str:
+    """Signature of the inputs to the last canonical Monthly write (see _ensure_canonical_monthly_note)."""
+    layout = f"{OBF_SEPARATOR}|{OBF_BUFFER_LINES}|{OBF_BUFFER_TOKEN}|{OBF_MIN_LEN}|{OBF_KEEP_FL}"
+    return _fingerprint(f"{rem_id}|{_fingerprint(full)}|{ratio:.6f}|{seed}|{sid}|{layout}")
+
+def _ensure_canonical_monthly_note(title: str, now: datetime, index: Optional[dict] = None) -> bool:
     """
     Rebuild the Monthly note from the canonical source of truth:
       - If '#manual_override' is present in the note, leave it untouched.
@@ -2117,50 +2977,61 @@ def _ensure_canonical_monthly_note(title: str, now: datetime) -> bool:
       - Compute visible ratio and seed for this month.
       - Build a SINGLE clean canonical body.
       - Append SID at the very bottom using the standard spacer.
+    Pass 'index' (from _build_title_index) to skip the per-title list scan.
     """
-    ln, it = _find_item_across_lists(title)
+    ln, it = _find_item_across_lists(title, index)
     if ln != MONTHLY or not it:
         return False
 
-    # Read raw body first to check for manual override
-    note_raw = get_body_by_id_raw(ln, it["id"])
+    # Fast path: same reminder, text, ratio, seed and SID as the last write → note is current
+    # (unless the listed note has since been blanked)
+    # Ratio & seed (seed may use obf_salt if present) depend only on the record's
+    # sid/monthly_count, which nothing below changes, so compute them once here
+    rec = _get_or_init_record(title)
+    ratio = _ratio_for_monthly_count(int(rec.get("monthly_count", 0)))
+    seed = _monthly_seed(title, rec)
+    cached_full = (rec.get("full_text") or "").strip()
+    if cached_full and rec.get("sid") and rec.get("note_sig") and (it.get("body") or "").strip():
+        sig = _monthly_note_sig(it["id"], cached_full, ratio, seed, rec["sid"])
+        if sig == rec["note_sig"]:
+            return True
+
+    # Raw body (already on the listed item) first, to check for manual override
+    note_raw = (it["body"] or "").strip() if "body" in it else get_body_by_id_raw(ln, it["id"])
     if _contains_manual_override(note_raw):
         return True  # respect manual override, no rewrite
 
     # Resolve canonical full text
-    full = _resolve_full_text_for(title, ln, it["id"])
+    full = _resolve_full_text_for(title, ln, it["id"], note_raw=note_raw)
     if not full:
         return False
 
-    # Ratio & seed (seed may use obf_salt if present)
-    rec = _get_or_init_record(title)
-    ratio = _ratio_for_monthly_count(int(rec.get("monthly_count", 0)))
-    seed = _monthly_seed(title, rec)
-
     # Ensure/obtain SID
-    sid = _extract_sid(note_raw) or rec.get("sid") or _ensure_sid_for_title(ln, title)
+    sid = (_extract_sid(note_raw) or rec.get("sid")
+           or _ensure_sid_for_title(ln, title, {_norm_title(title): it}, raw_body=note_raw))
 
     # Build canonical body WITHOUT SID, then append SID with spacer
     core = _note_with_obfuscation(full, ratio, seed)
     final_body = _append_sid(core, sid)
 
     # Only write if changed to avoid needless AppleScript writes
+    ok = True
     if note_raw.strip() != final_body.strip():
-        return set_body_by_id(ln, it["id"], final_body)
-    return True
+        ok = set_body_by_id(ln, it["id"], final_body)
+        if ok:
+            it["body"] = final_body  # keep a caller-held index current
+    if ok:
+        _update_record(title, note_sig=_monthly_note_sig(it["id"], full, ratio, seed, sid))
+    return ok
 
 
 
 
 
-def _ingest_full_text_from_note(list_name: str, rem_id: str, title: str) -> None:
-    try:
-        note_raw = get_body_by_id_raw(list_name, rem_id)
-    except Exception:
-        note_raw = ""
-    full = _extract_full_text(note_raw).strip()
-    if full:
-        _update_record(title, full_text=full, full_text_sha=_sha1(full))
+def _full_text_unchanged(rec: dict, text: str) -> bool:
+    """Cheap check before hashing/persisting: length first, then exact compare."""
+    stored = rec.get("full_text") or ""
+    return len(stored) == len(text) and stored == text
 
 def _roll_obf_salt(title: str) -> int:
     """
@@ -2178,13 +3049,27 @@ def _refresh_text_and_note(list_name: str, item: dict) -> bool:
     txt = fetch_scripture_text(title) or ""
     if not txt:
         return False
-    _update_record(title, full_text=txt, full_text_sha=_sha1(txt))
+    rec = _get_or_init_record(title)
+    changes = {}
+    if not _full_text_unchanged(rec, txt):
+        changes.update(full_text=txt, full_text_sha=_fingerprint(txt))
+    if rec.get("note_sig"):
+        changes["note_sig"] = ""  # force a rebuild
+    if changes:
+        _update_record(title, **changes)
+    return _rebuild_note(list_name, item, title)
+
+def _rebuild_note(list_name: str, item: dict, title: str) -> bool:
+    """Rewrite the note from state.full_text (Monthly gets the obfuscated layout), then ensure a SID."""
     if list_name == MONTHLY:
         ok = _ensure_canonical_monthly_note(title, datetime.now())
         if ok: _ensure_sid_for_title(MONTHLY, title)
         return bool(ok)
     else:
-        ok = ensure_notes_for(list_name, title)
+        if item.get("id"):
+            ok = ensure_notes_for_by_id(list_name, item["id"], title)
+        else:
+            ok = ensure_notes_for(list_name, title)
         if ok: _ensure_sid_for_title(list_name, title)
         return bool(ok)
 
@@ -2193,17 +3078,22 @@ def _refresh_text_and_note(list_name: str, item: dict) -> bool:
 # ====================================================================
 # SID helpers
 # ====================================================================
-def _ensure_sid_for_title(list_name: str, title: str) -> Optional[str]:
+def _ensure_sid_for_title(list_name: str, title: str,
+                          index: Optional[Dict[str, dict]] = None,
+                          raw_body: Optional[str] = None) -> Optional[str]:
     """
     Ensure the reminder has a SID, but NEVER create a SID-only note.
     If the note is blank, we first try to populate canonical text; only then append SID.
+    Pass 'index' (list_reminders_by_title output) when looping over a list already in hand,
+    and 'raw_body' when the caller has just read the note.
     """
-    items = list_reminders(list_name)
-    it = next((x for x in items if _norm_title(x["name"]) == _norm_title(title)), None)
+    if index is None:
+        index = list_reminders_by_title(list_name)
+    it = index.get(_norm_title(title))
     if not it:
         return None
 
-    note_raw = get_body_by_id_raw(list_name, it["id"])
+    note_raw = raw_body if raw_body is not None else (it.get("body") or "")
     sid = _extract_sid(note_raw)
 
     # If SID exists, ensure state has it and return
@@ -2237,7 +3127,7 @@ def _is_sid_only_note(s: str) -> bool:
     """True if, after removing any [sid:UUID], nothing else remains."""
     if not s:
         return False
-    without_sid = re.sub(r"\[sid:[0-9a-fA-F-]{36}\]", "", s).strip()
+    without_sid = _SID_RE.sub("", s).strip()
     return without_sid == ""
 
 def _repair_sid_only_notes_for_list(list_name: str) -> int:
@@ -2246,8 +3136,8 @@ def _repair_sid_only_notes_for_list(list_name: str) -> int:
     Returns count of repaired notes.
     """
     fixed = 0
-    for it in list_reminders(list_name):
-        raw = get_body_by_id_raw(list_name, it["id"])
+    for it in _cached_list_reminders(list_name):
+        raw = it.get("body") or ""
         if _is_sid_only_note(raw):
             if _refresh_text_and_note(list_name, it):
                 fixed += 1
@@ -2256,8 +3146,10 @@ def _repair_sid_only_notes_for_list(list_name: str) -> int:
     return fixed
 
 
-def _sha1(s: str) -> str:
-    return hashlib.sha1((s or "").encode("utf-8")).hexdigest()
+@lru_cache(maxsize=256)  # fills re-hash the same stored text repeatedly
+def _fingerprint(s: str) -> str:
+    """Content fingerprint (not security): 40 hex chars, same width as the old SHA-1."""
+    return hashlib.blake2b((s or "").encode("utf-8"), digest_size=20).hexdigest()
 
 def sid_sweep_for_list(list_name: str) -> int:
     """
@@ -2267,53 +3159,86 @@ def sid_sweep_for_list(list_name: str) -> int:
     Returns the number of SIDs newly added.
     """
     added = 0
-    for it in list_reminders(list_name):
-        body = (it.get("body") or "").strip()
-        has_sid = bool(_extract_sid_from_text(it.get("body") or ""))
-        if has_sid:
+    pending = []  # (item, new sid, new body) — written in one batched call
+    for it in _cached_list_reminders(list_name):
+        raw = it.get("body") or ""
+        if _extract_sid_from_text(raw):
             continue
 
-        if not body:
+        if not raw.strip():
             # Try to build canonical text; if it works, it will also ensure SID inside.
-            if _refresh_text_and_note(list_name, it):
+            # When state already holds the text, rebuild from it and skip the API fetch.
+            title = (it.get("name") or "").strip()
+            rec = _get_or_init_record(title) if title else {}
+            if (rec.get("full_text") or "").strip():
+                if rec.get("note_sig"):
+                    _update_record(title, note_sig="")  # blank note: the stored sig is stale
+                ok = _rebuild_note(list_name, it, title)
+            else:
+                ok = _refresh_text_and_note(list_name, it)
+            if ok:
                 added += 1  # _ensure_sid_for_title() is called inside refresh path
             else:
                 _append_log(f"[sid_sweep] skip SID-only risk for '{it.get('name','?')}' on '{list_name}': still blank after refresh")
             continue
 
         # Body has text but no SID → append SID
-        sid = _ensure_sid_for_title(list_name, it.get("name",""))
-        if sid:
-            added += 1
+        sid = _new_sid()
+        pending.append((it, sid, _append_sid(raw, sid)))
+
+    if pending:
+        written = batch_set_bodies(list_name, [(it["id"], body) for it, _, body in pending])
+        with _state_txn():
+            for it, sid, _ in pending:
+                if it["id"] not in written:
+                    continue
+                title = it.get("name", "")
+                if _get_or_init_record(title).get("sid") != sid:
+                    _update_record(title, sid=sid)
+                added += 1
 
     return added
 
 
 
 def _extract_sid_from_text(s: str) -> Optional[str]:
-    if not s:
-        return None
-    m = re.search(r"\[sid:([0-9a-fA-F-]{36})\]", s)
-    return m.group(1) if m else None
+    return _find_sid(s)
+
 
+# {sid: normalized_title_key}, rebuilt only when the state object or _STATE_GEN changes;
+# sid writes through _update_record/_migrate_state_title_by_sid patch it in place
+_SID_INDEX_CACHE: Dict[str, Any] = {"state": None, "gen": -1, "map": {}}
 
-def _sid_index_from_state() -> dict:
+def _get_sid_index(state: Optional[dict] = None) -> dict:
     """Return {sid: normalized_title_key} for all verses in state that have a sid."""
-    st = _load_state()
-    out = {}
-    for k, rec in (st.get("verses") or {}).items():
-        sid = rec.get("sid")
-        if sid:
-            out[sid] = k
-    return out
+    if state is None:
+        state = _load_state()
+    c = _SID_INDEX_CACHE
+    if c["state"] is not state or c["gen"] != _STATE_GEN:
+        items = list((state.get("verses") or {}).items())  # snapshot: fills may add records concurrently
+        c["map"] = {rec["sid"]: k for k, rec in items if rec.get("sid")}
+        c["state"], c["gen"] = state, _STATE_GEN
+    return c["map"]
+
+def _sid_index_patch(state: dict, gen_before: int, key: str, sid: Optional[str],
+                     old_sid: Optional[str] = None) -> None:
+    """Apply one sid→key change to a still-current _get_sid_index map instead of rebuilding it."""
+    c = _SID_INDEX_CACHE
+    if c["state"] is not state or c["gen"] != gen_before or _STATE_GEN != gen_before + 1:
+        return
+    m = c["map"]
+    if old_sid and m.get(old_sid) == key:
+        del m[old_sid]
+    if sid:
+        m[sid] = key
+    c["gen"] = _STATE_GEN
 
 def _migrate_state_title_by_sid(current_title: str, sid: str) -> bool:
     if not sid:
         return False
     state = _load_state()
     verses = state.setdefault("verses", {})
-    sid_map = { (rec.get("sid") or ""): key for key, rec in verses.items() if rec.get("sid") }
-    old_key = sid_map.get(sid)
+    old_key = _get_sid_index(state).get(sid)
     new_key = _norm_title(current_title)
     if not old_key or old_key == new_key or new_key in verses:
         return False
@@ -2324,14 +3249,16 @@ def _migrate_state_title_by_sid(current_title: str, sid: str) -> bool:
     verses[new_key] = rec
     try: del verses[old_key]
     except Exception: pass
+    gen = _STATE_GEN
     _save_state(state)
+    _sid_index_patch(state, gen, new_key, sid)
     _append_log(f"[migrate] '{old_key}' → '{new_key}' via SID {sid}")
     return True
 
 
 def _maybe_migrate_state_on_touch(list_name: str, item: dict) -> None:
     """
-    If sanitized body has a SID that maps to a different title in state,
+    If the listed body has a SID that maps to a different title in state,
     migrate the record to the current title and refresh text/note once.
     """
     try:
@@ -2349,24 +3276,77 @@ def _maybe_migrate_state_on_touch(list_name: str, item: dict) -> None:
 # ====================================================================
 # CSV logging
 # ====================================================================
+# Rows are buffered and written in one append by _flush_csv_events()
+# (end of run_daily, and at exit for everything else).
+# The file itself is opened once per run and closed at exit.
+_CSV_BUF: List[list] = []
+_CSV_FH: Optional[tuple] = None  # (path, file, csv.writer)
+
+def _csv_writer():
+    global _CSV_FH
+    if _CSV_FH is None or _CSV_FH[0] != CSV_PATH:
+        _csv_close()
+        os.makedirs(CONFIG_DIR, exist_ok=True)
+        newfile = not os.path.exists(CSV_PATH)
+        f = open(CSV_PATH, "a", newline="", encoding="utf-8", buffering=65536)
+        w = csv.writer(f)
+        if newfile:
+            w.writerow(["timestamp", "title", "stage", "action", "next_due"])
+        _CSV_FH = (CSV_PATH, f, w)
+    return _CSV_FH[2]
+
+def _csv_close() -> None:
+    global _CSV_FH
+    if _CSV_FH is not None:
+        try:
+            _CSV_FH[1].close()
+        except OSError:
+            pass
+        _CSV_FH = None
+
 def _append_csv_event(title: str, stage: str, action: str, next_due: str = "") -> None:
-    os.makedirs(CONFIG_DIR, exist_ok=True)
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    ts = _now_str()
+    _CSV_BUF.append([ts, title, stage, action, next_due])
+
+def _flush_csv_events() -> None:
+    if not _CSV_BUF:
+        return
+    rows = _CSV_BUF[:]
+    del _CSV_BUF[:]
     try:
-        newfile = not os.path.exists(CSV_PATH)
-        with open(CSV_PATH, "a", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            if newfile:
-                w.writerow(["timestamp", "title", "stage", "action", "next_due"])
-            w.writerow([ts, title, stage, action, next_due])
+        _csv_writer().writerows(rows)
+        _CSV_FH[1].flush()
     except Exception as e:
+        _csv_close()
         _append_log(f"[csv] ERROR {e}")
 
+def _close_csv_log() -> None:
+    _flush_csv_events()
+    _csv_close()
+
+atexit.register(_close_csv_log)
+
 
 # ====================================================================
 # Tiny CLI and run loop
 # ====================================================================
-def run_daily(topic_arg: Optional[str] = None):
+def _resolve_topic(cli_topic: Optional[str]) -> Optional[str]:
+    """CLI topic if one was given, else the configured auto_add.topic_default."""
+    if cli_topic and cli_topic.strip():
+        return cli_topic.strip()
+    return AUTO_ADD_TOPIC_DEFAULT
+
+def _safe(label: str, fn, *args, **kwargs):
+    """Run one run-daily step, logging '<label> OK' or '<label> ERROR: ...'."""
+    try:
+        fn(*args, **kwargs)
+    except Exception as e:
+        _append_log(f"run-daily: {label} ERROR: {e}")
+        return
+    _append_log(f"run-daily: {label} OK")
+
+@_with_state_txn
+def run_daily(topic_arg: Optional[str] = None, cfg: Optional[dict] = None):
     """
     One 'daily' run:
       1) cleanup_deleted_items()  # remove deleted items from state
@@ -2377,59 +3357,41 @@ def run_daily(topic_arg: Optional[str] = None):
       6) fill_notes_for_monthly()
       7) maybe_add_new_verse_from_backlog()
       8) scheduled weekly '--fix' if due (config-driven; minimal overhead)
+    Pass 'cfg' when it is already loaded and applied (the CLI does this).
     """
-    cfg = load_or_init_config()
-    apply_config(cfg)
+    if cfg is None:
+        cfg = load_or_init_config()
+        apply_config(cfg)
 
-    cfg_topic = (cfg.get("auto_add", {}) or {}).get("topic_default", "") or None
-    topic = topic_arg if (topic_arg and topic_arg.strip()) else cfg_topic
+    topic = _resolve_topic(topic_arg)
 
     _append_log("run-daily: start")
 
-    try:
-        cleanup_deleted_items()
-        _append_log("run-daily: cleanup_deleted_items OK")
-    except Exception as e:
-        _append_log(f"run-daily: cleanup_deleted_items ERROR: {e}")
-
-    try:
-        reset_backlog_items()
-        _append_log("run-daily: reset_backlog_items OK")
-    except Exception as e:
-        _append_log(f"run-daily: reset_backlog_items ERROR: {e}")
-
-    try:
-        advance_on_complete()
-        _append_log("run-daily: advance_on_complete OK")
-    except Exception as e:
-        _append_log(f"run-daily: advance_on_complete ERROR: {e}")
-
-    try:
-        fill_notes_for_daily()
-        _append_log("run-daily: fill_notes_for_daily OK")
-    except Exception as e:
-        _append_log(f"run-daily: fill_notes_for_daily ERROR: {e}")
-
-    try:
-        fill_notes_for_weekly()
-        _append_log("run-daily: fill_notes_for_weekly OK")
-    except Exception as e:
-        _append_log(f"run-daily: fill_notes_for_weekly ERROR: {e}")
-
-    try:
-        fill_notes_for_monthly()
-        _append_log("run-daily: fill_notes_for_monthly OK")
-    except Exception as e:
-        _append_log(f"run-daily: fill_notes_for_monthly ERROR: {e}")
-
-    try:
-        moved_or_added = maybe_add_new_verse_from_backlog(topic=topic)
-        if moved_or_added:
-            _append_log(f"run-daily: new verse added/moved → {moved_or_added}")
-        else:
-            _append_log("run-daily: no new verse added/moved")
-    except Exception as e:
-        _append_log(f"run-daily: maybe_add_new_verse_from_backlog ERROR: {e}")
+    for fn in (cleanup_deleted_items, reset_backlog_items, advance_on_complete):
+        _safe(fn.__name__, fn)
+
+    # One outer state transaction and list cache scope for the three fills, so
+    # state is written once and per-item body reads are served from the listing
+    # each fill already made. They run one after another: they share the state
+    # dict, the SID index and the list cache, none of which is locked. Their
+    # scripture fetches still overlap through prefetch_scripture_texts.
+    with _state_txn(), _list_cache_scope():
+        for fn in (fill_notes_for_daily, fill_notes_for_weekly, fill_notes_for_monthly):
+            _safe(fn.__name__, fn)
+
+    # Intake is gated every_n_days; on other days skip it (and its list scan /
+    # Backlog cleanup, which reruns before the next intake anyway).
+    if not _chatgpt_allowed_today(datetime.now()):
+        _append_log("run-daily: skipped auto-add (frequency gate)")
+    else:
+        try:
+            moved_or_added = maybe_add_new_verse_from_backlog(topic=topic)
+            if moved_or_added:
+                _append_log(f"run-daily: new verse added/moved → {moved_or_added}")
+            else:
+                _append_log("run-daily: no new verse added/moved")
+        except Exception as e:
+            _append_log(f"run-daily: maybe_add_new_verse_from_backlog ERROR: {e}")
 
     # Scheduled maintenance (quiet, config-driven)
     try:
@@ -2437,7 +3399,9 @@ def run_daily(topic_arg: Optional[str] = None):
     except Exception as e:
         _append_log(f"run-daily: scheduled-fix ERROR: {e}")
 
+    _flush_csv_events()  # one bulk write for every CSV event of this run
     _append_log("run-daily: done")
+    _flush_log()
 
 
 
@@ -2448,84 +3412,110 @@ def ensure_all_lists_cmd():
 def print_status_cmd():
     print_status()
 
-def debug_dump_cmd():
-    debug_dump()
-
-def dump_state_cmd():
-    dump_state()
-
 def cli_test_fetch_cmd(ref: str):
     cli_test_fetch(ref)
 
-def main():
-    cfg = load_or_init_config()
-    apply_config(cfg)
-
-    cmd = sys.argv[1] if len(sys.argv) > 1 else "help"
-
-    if cmd == "new-verse":
-        cfg = load_or_init_config()
-        apply_config(cfg)
-        cfg_topic = (cfg.get("auto_add", {}) or {}).get("topic_default", "") or None
-        cli_topic = " ".join(sys.argv[2:]).strip() if len(sys.argv) > 2 else None
-        topic = cli_topic if (cli_topic and cli_topic.strip()) else cfg_topic
+# CLI dispatch table, filled by @_command in definition order (which is also
+# the order 'help' lists them); main() loads and applies config once before
+# dispatch, except for commands registered with needs_config=False.
+COMMANDS: Dict[str, Any] = {}
+_COMMAND_HELP: List[tuple] = []  # (usage, description)
+_NO_CONFIG_COMMANDS = set()  # handlers that run without config and get cfg=None
+
+def _command(name: str, description: str, usage: Optional[str] = None, needs_config: bool = True):
+    """Register a `_cmd_*(cfg, args)` handler under `name` and document it for 'help'."""
+    def deco(fn):
+        COMMANDS[name] = fn
+        _COMMAND_HELP.append((usage or name, description))
+        if not needs_config:
+            _NO_CONFIG_COMMANDS.add(name)
+        return fn
+    return deco
+
+def _cli_tail(args: List[str]) -> Optional[str]:
+    """Remaining CLI words as one stripped string, or None when there are none."""
+    if not args:
+        return None
+    tail = args[0] if len(args) == 1 else " ".join(args)
+    return tail.strip() or None
+
+@_command("new-verse", "Backlog → Daily (dedupe, due 8am, fill notes), or ChatGPT if empty & allowed",
+          usage="new-verse [topic]")
+def _cmd_new_verse(cfg: dict, args: List[str]) -> None:
+    topic = _resolve_topic(_cli_tail(args))
+    # One list-cache scope per command: the closing dump reuses lists the writes left valid
+    with _list_cache_scope():
         maybe_add_new_verse_from_backlog(topic=topic)
         debug_dump()
 
-    elif cmd == "advance":
+@_command("advance", "Reschedule/move after you mark complete")
+def _cmd_advance(cfg: dict, args: List[str]) -> None:
+    with _list_cache_scope():
         advance_on_complete()
         debug_dump()
 
-    elif cmd == "fill-notes":
+@_command("fill-notes", "Fill notes for Daily/Weekly/Monthly if blank")
+def _cmd_fill_notes(cfg: dict, args: List[str]) -> None:
+    with _state_txn(), _list_cache_scope():
         fill_notes_for_daily()
         fill_notes_for_weekly()
         fill_notes_for_monthly()
         debug_dump()
 
-    elif cmd == "state":
-        dump_state()
+@_command("test-fetch", "Fetch and print one reference", usage='test-fetch "Mosiah 2:21-22"')
+def _cmd_test_fetch(cfg: dict, args: List[str]) -> None:
+    ref = _cli_tail(args)
+    if not ref:
+        print('Usage: python scripture_agent.py test-fetch "Book Chapter:Verse[-Verse]"')
+    else:
+        cli_test_fetch_cmd(ref)
 
-    elif cmd == "test-fetch":
-        ref = " ".join(sys.argv[2:]).strip()
-        if not ref:
-            print('Usage: python scripture_agent.py test-fetch "Book Chapter:Verse[-Verse]"')
-        else:
-            cli_test_fetch_cmd(ref)
-
-    elif cmd == "help":
-        print("Usage:")
-        print("  python scripture_agent.py new-verse    # Backlog → Daily (dedupe, due 8am, init state, fill notes via API)")
-        print("  python scripture_agent.py advance      # Reschedule/move after you mark complete")
-        print("  python scripture_agent.py fill-notes   # Fill notes for Daily/Weekly/Monthly if blank")
-        print('  python scripture_agent.py test-fetch "Mosiah 2:21-22"')
-        print("  python scripture_agent.py state        # Show cadence state file")
-        print('  python scripture_agent.py new-verse [topic]   # Backlog or (if empty & allowed) ChatGPT')
-        print("  python scripture_agent.py config       # Show merged config currently in use")
-        print("  python scripture_agent.py status       # Show stages, counts, and next due for all verses")
-        print("  python scripture_agent.py setup        # Create any missing lists from config")
-        print("  python scripture_agent.py doctor       # Check lists, config, APIs, env")
-        print('  python scripture_agent.py run-daily [topic]  # Advance, fill notes, then add new verse if needed')
-
-    elif cmd == "config":
-        cfg = load_or_init_config()
-        apply_config(cfg)
-        print(json.dumps(cfg, indent=2))
+@_command("clear-cache", "Forget cached scripture text (refetch on next use)")
+def _cmd_clear_cache(cfg: dict, args: List[str]) -> None:
+    print(f"Cleared {clear_scripture_cache()} cached scripture lookup(s).")
 
-    elif cmd == "status":
-        print_status_cmd()
+@_command("state", "Show cadence state file", needs_config=False)
+def _cmd_state(cfg: dict, args: List[str]) -> None:
+    dump_state()
 
-    elif cmd == "setup":
-        ensure_all_lists_cmd()
+@_command("config", "Show merged config currently in use")
+def _cmd_config(cfg: dict, args: List[str]) -> None:
+    print(json.dumps(cfg, indent=2))
 
-    elif cmd == "doctor":
-        doctor()
+@_command("status", "Show stages, counts, and next due for all verses")
+def _cmd_status(cfg: dict, args: List[str]) -> None:
+    print_status_cmd()
 
-    elif cmd == "run-daily":
-        topic = " ".join(sys.argv[2:]).strip() if len(sys.argv) > 2 else None
-        run_daily(topic_arg=topic)
+@_command("setup", "Create any missing lists from config")
+def _cmd_setup(cfg: dict, args: List[str]) -> None:
+    ensure_all_lists_cmd()
 
-    else:
+@_command("doctor", "Check lists, config, APIs, env")
+def _cmd_doctor(cfg: dict, args: List[str]) -> None:
+    doctor()
+
+@_command("run-daily", "Advance, fill notes, then add new verse if needed", usage="run-daily [topic]")
+def _cmd_run_daily(cfg: dict, args: List[str]) -> None:
+    run_daily(topic_arg=_cli_tail(args), cfg=cfg)
+
+@_command("help", "Show this list", needs_config=False)
+def _cmd_help(cfg: dict, args: List[str]) -> None:
+    width = max(len(usage) for usage, _ in _COMMAND_HELP)
+    print("Usage:")
+    for usage, description in _COMMAND_HELP:
+        print(f"  python scripture_agent.py {usage:<{width}}  # {description}")
+
+def main():
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "help"
+    handler = COMMANDS.get(cmd)
+    if handler is None:
         print(f"Unknown command: {cmd} (run 'help')")
+        return
+    cfg = None
+    if cmd not in _NO_CONFIG_COMMANDS:
+        cfg = load_or_init_config()
+        apply_config(cfg)
+    handler(cfg, sys.argv[2:])
 
 if __name__ == "__main__":
     main()